@@ -26,6 +26,7 @@ from routers.release_router import release_router
 from routers.analytics_router import analytics_router
 from routers.social_router import social_router
 from routers import projects_router, credits_router
+from services.rvc_gradio_service import aclose_http_client
 from utils.rate_limit import RateLimiterMiddleware
 from database import init_db
 from config.settings import settings, MEDIA_DIR
@@ -198,6 +199,12 @@ async def initialize_database():
         logger.error(f"❌ Database initialization failed: {e}")
         raise
 
+# Release pooled outbound connections on shutdown
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close the shared Gradio HTTP client."""
+    await aclose_http_client()
+
 # ============================================================================
 # INCLUDE ROUTERS
 # ============================================================================
@@ -6,6 +6,7 @@ Persistent, contextual memory system for AI voices
 import json
 import os
 import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -18,6 +19,20 @@ from database_models import Project
 
 logger = logging.getLogger(__name__)
 
+# project.json is rewritten on every save; orjson encodes it natively
+try:
+    import orjson
+
+    def _dump_json(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    _load_json = json.loads
+
 class ProjectMemory:
     """
     Manages persistent project memory across sessions.
@@ -39,14 +54,16 @@ class ProjectMemory:
         self.project_file = self.session_path / "project.json"
         self.project_data = None  # Will be loaded asynchronously
         self.db_project = None  # Database Project record
+        self._batch_depth = 0  # > 0 while inside batch(); saves are deferred
+        self._dirty = False
     
     async def _load_or_create(self) -> Dict:
         """Load existing project or create new one"""
         file_exists = await asyncio.to_thread(self.project_file.exists)
         if file_exists:
-            async with aiofiles.open(self.project_file, 'r') as f:
+            async with aiofiles.open(self.project_file, 'rb') as f:
                 content = await f.read()
-                return json.loads(content)
+                return _load_json(content)
         
         project_data = {
             "session_id": self.session_id,
@@ -119,6 +136,10 @@ class ProjectMemory:
     
     async def save(self):
         """Save project data to disk and update database"""
+        if self._batch_depth:
+            self._dirty = True
+            return
+
         self.project_data["updated_at"] = datetime.now().isoformat()
         
         # Update database Project record if db session is available
@@ -136,10 +157,30 @@ class ProjectMemory:
                 # Continue with file save even if DB update fails
         
         # Save to JSON file
-        async with aiofiles.open(self.project_file, 'w') as f:
-            await f.write(json.dumps(self.project_data, indent=2))
+        async with aiofiles.open(self.project_file, 'wb') as f:
+            await f.write(_dump_json(self.project_data))
         logger.info(f"Project memory saved for session {self.session_id}")
     
+    @asynccontextmanager
+    async def batch(self):
+        """
+        Defer saves until the block exits, then write once.
+        Example:
+            async with memory.batch():
+                await memory.update_metadata(tempo=120)
+                await memory.advance_stage("beat", "lyrics")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            # Flush even if the block raised, so updates made before the
+            # error are persisted as they were without batching
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                await self.save()
+
     async def update_metadata(self, **kwargs):
         """Update project metadata"""
         for key, value in kwargs.items():
@@ -381,9 +422,9 @@ async def list_all_projects(media_dir: Path) -> List[Dict]:
             file_exists = await asyncio.to_thread(project_file.exists)
             if file_exists:
                 try:
-                    async with aiofiles.open(project_file, 'r') as f:
+                    async with aiofiles.open(project_file, 'rb') as f:
                         content = await f.read()
-                        data = json.loads(content)
+                        data = _load_json(content)
                         projects.append({
                             "session_id": item.name,
                             "title": data["metadata"].get("track_title", "Untitled"),
@@ -375,10 +375,9 @@ async def run_clean_wrapper(
         beat_path = base / "beat.mp3"
         
         stems = {}
-        if vocal_path.exists():
-            stems["vocal"] = str(vocal_path)
-        if beat_path.exists():
-            stems["beat"] = str(beat_path)
+        for stem_name, stem_path in (("vocal", str(vocal_path)), ("beat", str(beat_path))):
+            if os.path.isfile(stem_path):
+                stems[stem_name] = stem_path
         
         if not stems:
             return error_response("NO_STEMS", 400, "No stems provided for mixing")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, Body
+from fastapi.responses import StreamingResponse
 
 from backend.utils.responses import success_response, error_response
 from services.release_service import ReleaseService
@@ -45,3 +46,17 @@ async def generate_zip(project_id: str):
     if result.get("is_error"):
         return error_response(result.get("error", "Unknown error"))
     return success_response(result["data"])
+
+
+@release_router.get("/{project_id}/zip/stream")
+async def stream_zip(project_id: str):
+    try:
+        pack = service.iter_release_pack(project_id)
+    except FileNotFoundError:
+        return error_response("Project not found", status=404)
+
+    return StreamingResponse(
+        pack,
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{project_id}_release_pack.zip"'},
+    )
@@ -1,6 +1,7 @@
 """
 Beat Service - Business logic for beat generation
 """
+import os
 import uuid
 import shutil
 import asyncio
@@ -23,6 +24,19 @@ from config.settings import MEDIA_DIR
 ASSETS_DIR = Path("./assets")
 
 
+def _link_or_copy(src: Path, dst: Path):
+    """
+    Hardlink src to dst (one linkat, no bytes copied), falling back to a
+    copy across filesystems. Anything that later rewrites dst must unlink
+    it first so the shared inode is never truncated.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
 class BeatService:
     """Service class for beat generation business logic"""
     
@@ -220,6 +234,7 @@ class BeatService:
                     output_file = session_path / "beat.mp3"
                     audio_data = await client.get(audio_url, timeout=60)
                     audio_data.raise_for_status()
+                    output_file.unlink(missing_ok=True)  # may be linked to the demo beat
                     with open(output_file, "wb") as f:
                         f.write(audio_data.content)
                     
@@ -243,29 +258,29 @@ class BeatService:
                     
                     # Update project memory
                     memory = await get_or_create_project_memory(session_id, MEDIA_DIR, None, db)
-                    await memory.update_metadata(tempo=extracted_bpm, mood=mood, genre=genre)
-                    beat_url = f"/media/{session_id}/beat.mp3"
-                    await memory.add_asset("beat", beat_url, {"bpm": extracted_bpm, "mood": mood, "metadata": extracted_metadata})
-                    await memory.advance_stage("beat", "lyrics")
+                    async with memory.batch():
+                        await memory.update_metadata(tempo=extracted_bpm, mood=mood, genre=genre)
+                        beat_url = f"/media/{session_id}/beat.mp3"
+                        await memory.add_asset("beat", beat_url, {"bpm": extracted_bpm, "mood": mood, "metadata": extracted_metadata})
+                        await memory.advance_stage("beat", "lyrics")
                     
-                    # Prepare beat_url and beat_meta for project memory
-                    beat_meta = {
-                        "bpm": extracted_bpm,
-                        "mood": mood,
-                        "genre": genre,
-                        "provider": "beatoven",
-                        **extracted_metadata
-                    }
+                        # Prepare beat_url and beat_meta for project memory
+                        beat_meta = {
+                            "bpm": extracted_bpm,
+                            "mood": mood,
+                            "genre": genre,
+                            "provider": "beatoven",
+                            **extracted_metadata
+                        }
                     
-                    # Auto-save to project memory
-                    if "beat" not in memory.project_data:
-                        memory.project_data["beat"] = {}
-                    memory.project_data["beat"].update({
-                        "url": beat_url,
-                        "meta": beat_meta,
-                        "completed": True
-                    })
-                    await memory.save()
+                        # Auto-save to project memory
+                        if "beat" not in memory.project_data:
+                            memory.project_data["beat"] = {}
+                        memory.project_data["beat"].update({
+                            "url": beat_url,
+                            "meta": beat_meta,
+                            "completed": True
+                        })
                     
                     log_endpoint_event("/beats/create", session_id, "success", {"source": "beatoven", "mood": mood})
                     
@@ -297,6 +312,7 @@ class BeatService:
         db: Optional[AsyncSession] = None
     ) -> Dict[str, Any]:
         """Create fallback beat (demo or silent)"""
+        memory = None
         try:
             # Ensure demo_beats directory exists
             demo_beats_dir = MEDIA_DIR / "demo_beats"
@@ -308,7 +324,7 @@ class BeatService:
                 # Try to copy from assets if it exists
                 source_beat = ASSETS_DIR / "demo" / "beat.mp3"
                 if source_beat.exists():
-                    shutil.copy(source_beat, fallback)
+                    _link_or_copy(source_beat, fallback)
                     logger.info(f"Created fallback beat at {fallback}")
                 else:
                     # Create silent audio clip as fallback
@@ -324,36 +340,36 @@ class BeatService:
                 logger.warning(f"Fallback beat not applied because beat.mp3 already exists for session {session_id}")
                 provider = "demo_skipped"
             else:
-                shutil.copy(fallback, output_file)
+                _link_or_copy(fallback, output_file)
                 logger.info(f"⚠️ Beatoven unavailable, using fallback demo beat")
                 provider = "demo"
             
             # Update project memory
             memory = await get_or_create_project_memory(session_id, MEDIA_DIR, None, db)
             demo_metadata = {"duration": 180, "bpm": bpm or 120, "key": "C"}
-            await memory.update_metadata(tempo=bpm or 120, mood=mood, genre=genre)
-            beat_url = f"/media/{session_id}/beat.mp3"
-            await memory.add_asset("beat", beat_url, {"bpm": bpm or 120, "mood": mood, "source": "demo", "metadata": demo_metadata})
-            await memory.advance_stage("beat", "lyrics")
+            async with memory.batch():
+                await memory.update_metadata(tempo=bpm or 120, mood=mood, genre=genre)
+                beat_url = f"/media/{session_id}/beat.mp3"
+                await memory.add_asset("beat", beat_url, {"bpm": bpm or 120, "mood": mood, "source": "demo", "metadata": demo_metadata})
+                await memory.advance_stage("beat", "lyrics")
             
-            # Prepare beat_url and beat_meta for project memory
-            beat_meta = {
-                "bpm": bpm or 120,
-                "mood": mood,
-                "genre": genre,
-                "provider": provider,
-                **demo_metadata
-            }
+                # Prepare beat_url and beat_meta for project memory
+                beat_meta = {
+                    "bpm": bpm or 120,
+                    "mood": mood,
+                    "genre": genre,
+                    "provider": provider,
+                    **demo_metadata
+                }
             
-            # Auto-save to project memory
-            if "beat" not in memory.project_data:
-                memory.project_data["beat"] = {}
-            memory.project_data["beat"].update({
-                "url": beat_url,
-                "meta": beat_meta,
-                "completed": True
-            })
-            await memory.save()
+                # Auto-save to project memory
+                if "beat" not in memory.project_data:
+                    memory.project_data["beat"] = {}
+                memory.project_data["beat"].update({
+                    "url": beat_url,
+                    "meta": beat_meta,
+                    "completed": True
+                })
             
             log_endpoint_event("/beats/create", session_id, "success", {"source": provider, "mood": mood})
             
@@ -371,10 +387,13 @@ class BeatService:
             logger.error(f"Fallback beat creation failed: {e} - creating silent audio in session")
             try:
                 output_file = session_path / "beat.mp3"
+                output_file.unlink(missing_ok=True)  # may be linked to the demo beat
                 silent_audio = AudioSegment.silent(duration=(duration_sec or 180) * 1000)
                 silent_audio.export(str(output_file), format="mp3")
                 
-                memory = await get_or_create_project_memory(session_id, MEDIA_DIR, None, db)
+                # Reuse the project memory already loaded above, if any
+                if memory is None:
+                    memory = await get_or_create_project_memory(session_id, MEDIA_DIR, None, db)
                 silent_metadata = {"duration": duration_sec or 180, "bpm": bpm or 120, "key": "C"}
                 await memory.update_metadata(tempo=bpm or 120, mood=mood, genre=genre)
                 beat_url = f"/media/{session_id}/beat.mp3"
@@ -537,6 +556,7 @@ class BeatService:
                     output_file = session_path / "beat.mp3"
                     audio_data = await client.get(audio_url, timeout=60)
                     audio_data.raise_for_status()
+                    output_file.unlink(missing_ok=True)  # may be linked to the demo beat
                     with open(output_file, "wb") as f:
                         f.write(audio_data.content)
                     
@@ -565,29 +585,29 @@ class BeatService:
                     project_genre = memory.project_data.get("metadata", {}).get("genre", "hip-hop")
                     
                     # Update project memory
-                    await memory.update_metadata(tempo=extracted_bpm, mood=project_mood, genre=project_genre)
-                    beat_url = f"/media/{session_id}/beat.mp3"
-                    await memory.add_asset("beat", beat_url, {"bpm": extracted_bpm, "mood": project_mood, "metadata": extracted_metadata})
-                    await memory.advance_stage("beat", "lyrics")
+                    async with memory.batch():
+                        await memory.update_metadata(tempo=extracted_bpm, mood=project_mood, genre=project_genre)
+                        beat_url = f"/media/{session_id}/beat.mp3"
+                        await memory.add_asset("beat", beat_url, {"bpm": extracted_bpm, "mood": project_mood, "metadata": extracted_metadata})
+                        await memory.advance_stage("beat", "lyrics")
                     
-                    # Prepare beat_url and beat_meta for project memory
-                    beat_meta = {
-                        "bpm": extracted_bpm,
-                        "mood": project_mood,
-                        "genre": project_genre,
-                        "provider": "beatoven",
-                        **extracted_metadata
-                    }
+                        # Prepare beat_url and beat_meta for project memory
+                        beat_meta = {
+                            "bpm": extracted_bpm,
+                            "mood": project_mood,
+                            "genre": project_genre,
+                            "provider": "beatoven",
+                            **extracted_metadata
+                        }
                     
-                    # Auto-save to project memory
-                    if "beat" not in memory.project_data:
-                        memory.project_data["beat"] = {}
-                    memory.project_data["beat"].update({
-                        "url": beat_url,
-                        "meta": beat_meta,
-                        "completed": True
-                    })
-                    await memory.save()
+                        # Auto-save to project memory
+                        if "beat" not in memory.project_data:
+                            memory.project_data["beat"] = {}
+                        memory.project_data["beat"].update({
+                            "url": beat_url,
+                            "meta": beat_meta,
+                            "completed": True
+                        })
                     
                     log_endpoint_event("/beats/status", session_id, "success", {"source": "beatoven", "job_id": job_id})
                     
@@ -1,6 +1,7 @@
 import uuid
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
 from datetime import datetime
@@ -11,11 +12,18 @@ from project_memory import get_or_create_project_memory
 from social_scheduler import SocialScheduler
 from backend.utils.responses import success_response, error_response
 from config.settings import settings, MEDIA_DIR
-from utils.shared_utils import get_session_media_path
+from utils.shared_utils import get_session_media_path, schedule_lock, read_schedule, write_schedule
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _openai_client(api_key: str):
+    """One OpenAI client per key, so requests share its connection pool"""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
 class ContentService:
 
     @staticmethod
@@ -43,8 +51,7 @@ class ContentService:
             return {"error": "OpenAI API key is required for video idea generation. Please configure OPENAI_API_KEY in your environment.", "is_error": True}
         
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             prompt = f"""Generate a simple, practical video idea for a {mood} {genre} track titled "{title}".
 
@@ -104,8 +111,7 @@ Example format:
             return {"error": "OpenAI API key is required for video analysis. Please configure OPENAI_API_KEY in your environment.", "is_error": True}
         
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             prompt = f"""Analyze this video transcript for viral potential on TikTok/Instagram Reels.
 
@@ -178,8 +184,7 @@ Example format:
             return {"error": "OpenAI API key is required for text generation. Please configure OPENAI_API_KEY in your environment.", "is_error": True}
         
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = _openai_client(api_key)
             
             prompt = f"""Generate social media content for a {request.mood or "energetic"} {request.genre or "hip hop"} track titled "{request.title or "My Track"}".
 
@@ -254,8 +259,9 @@ Example format:
                 if result.get("success"):
                     # Update project memory
                     memory = await get_or_create_project_memory(session_id, MEDIA_DIR)
-                    await memory.update("contentScheduled", True)
-                    await memory.advance_stage("content", "analytics")
+                    async with memory.batch():
+                        await memory.update("contentScheduled", True)
+                        await memory.advance_stage("content", "analytics")
                     
                     return {
                         "data": {
@@ -274,17 +280,9 @@ Example format:
             session_path = get_session_media_path(session_id)
             schedule_file = session_path / "schedule.json"
             
-            # Load existing schedule
-            if schedule_file.exists():
-                with open(schedule_file, 'r') as f:
-                    schedule = json.load(f)
-            else:
-                schedule = []
-            
             # Create post ID
             post_id = f"{request.platform}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
-            # Append new post
             post = {
                 "post_id": post_id,
                 "platform": request.platform,
@@ -296,16 +294,18 @@ Example format:
                 "provider": "local",
                 "status": "scheduled"
             }
-            schedule.append(post)
             
-            # Save
-            with open(schedule_file, 'w') as f:
-                json.dump(schedule, f, indent=2)
+            # Load, append and save under the file's lock
+            async with schedule_lock(schedule_file):
+                schedule = await read_schedule(schedule_file)
+                schedule.append(post)
+                await write_schedule(schedule_file, schedule)
             
             # Update project memory
             memory = await get_or_create_project_memory(session_id, MEDIA_DIR)
-            await memory.update("contentScheduled", True)
-            await memory.advance_stage("content", "analytics")
+            async with memory.batch():
+                await memory.update("contentScheduled", True)
+                await memory.advance_stage("content", "analytics")
             
             return {
                 "data": {
@@ -338,13 +338,6 @@ Example format:
         session_path = get_session_media_path(session_id)
         schedule_file = session_path / "schedule.json"
         
-        # Load existing schedule
-        if schedule_file.exists():
-            with open(schedule_file, 'r') as f:
-                schedule = json.load(f)
-        else:
-            schedule = []
-        
         # Create post entry
         post = {
             "post_id": f"{request.platform}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -355,11 +348,12 @@ Example format:
             "created_at": datetime.now().isoformat(),
             "status": "scheduled"
         }
-        schedule.append(post)
         
-        # Save
-        with open(schedule_file, 'w') as f:
-            json.dump(schedule, f, indent=2)
+        # Load, append and save under the file's lock
+        async with schedule_lock(schedule_file):
+            schedule = await read_schedule(schedule_file)
+            schedule.append(post)
+            await write_schedule(schedule_file, schedule)
         
         # Update project memory
         memory = await get_or_create_project_memory(session_id, MEDIA_DIR)
@@ -376,12 +370,8 @@ Example format:
         session_path = get_session_media_path(session_id)
         schedule_file = session_path / "schedule.json"
         
-        if not schedule_file.exists():
-            return {"data": [], "is_error": False}
-        
         try:
-            with open(schedule_file, 'r') as f:
-                schedule = json.load(f)
+            schedule = await read_schedule(schedule_file)
             return {"data": schedule, "is_error": False}
         except Exception as e:
             logger.error(f"Failed to load schedule: {e}")
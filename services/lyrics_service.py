@@ -19,12 +19,24 @@ logger = logging.getLogger(__name__)
 # Constants
 from config.settings import MEDIA_DIR
 
+_SECTION_HEADER_RE = re.compile(r'^\[(Hook|Chorus|Verse\s*\d*|Bridge|Intro|Outro|Pre-Chorus)\](.*)$', re.IGNORECASE)
+_DIGITS_RE = re.compile(r'\d+')
+_SECTION_KEY_STRIP = str.maketrans('', '', ' -')
+
 
 class LyricsService:
     """Service class for lyrics generation business logic"""
     
     def __init__(self):
         self.api_key = settings.openai_api_key
+        self._client = None
+
+    @property
+    def client(self) -> OpenAI:
+        """Shared OpenAI client; keeps its connection pool warm across requests"""
+        if self._client is None:
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
     
     def detect_bpm(self, filepath: Path) -> int:
         """Detect BPM from audio file using aubio"""
@@ -94,7 +106,7 @@ Standing tall, I claim my name"""
             return fallback_lyrics
         
         try:
-            client = OpenAI(api_key=self.api_key)
+            client = self.client
             
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -123,15 +135,15 @@ Standing tall, I claim my name"""
         
         for line in lines:
             # Detect section headers: [Hook], [Chorus], [Verse 1], [Verse], [Bridge], etc.
-            section_match = re.match(r'^\[(Hook|Chorus|Verse\s*\d*|Bridge|Intro|Outro|Pre-Chorus)\](.*)$', line, re.IGNORECASE)
+            section_match = _SECTION_HEADER_RE.match(line)
             
             if section_match:
                 # Save previous section
                 if current_section and current_lines:
-                    section_key = current_section.lower().replace(' ', '').replace('-', '')
+                    section_key = current_section.lower().translate(_SECTION_KEY_STRIP)
                     # Handle verse numbers
                     if 'verse' in section_key:
-                        num_match = re.search(r'\d+', current_section)
+                        num_match = _DIGITS_RE.search(current_section)
                         if num_match:
                             section_key = f"verse{num_match.group()}"
                         else:
@@ -146,9 +158,9 @@ Standing tall, I claim my name"""
         
         # Save last section
         if current_section and current_lines:
-            section_key = current_section.lower().replace(' ', '').replace('-', '')
+            section_key = current_section.lower().translate(_SECTION_KEY_STRIP)
             if 'verse' in section_key:
-                num_match = re.search(r'\d+', current_section)
+                num_match = _DIGITS_RE.search(current_section)
                 if num_match:
                     section_key = f"verse{num_match.group()}"
                 else:
@@ -198,7 +210,7 @@ This is where we all belong"""
         # Try OpenAI if key available
         if self.api_key:
             try:
-                client = OpenAI(api_key=self.api_key)
+                client = self.client
                 
                 beat_context_str = ""
                 if beat_context:
@@ -261,8 +273,9 @@ Make it authentic and emotionally resonant."""
         
         # Update project memory
         memory = await get_or_create_project_memory(session_id, MEDIA_DIR, None)
-        await memory.add_asset("lyrics", f"/media/{session_id}/lyrics.txt", {"genre": genre, "mood": mood})
-        await memory.advance_stage("lyrics", "upload")
+        async with memory.batch():
+            await memory.add_asset("lyrics", f"/media/{session_id}/lyrics.txt", {"genre": genre, "mood": mood})
+            await memory.advance_stage("lyrics", "upload")
         
         log_endpoint_event("/songs/write", session_id, "success", {"provider": provider})
         
@@ -463,7 +476,7 @@ Rewrite the lyrics according to the instruction while maintaining NP22 style. Re
             return {"lyrics": fallback_lyrics}
         
         try:
-            client = OpenAI(api_key=self.api_key)
+            client = self.client
             
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
@@ -1,7 +1,11 @@
 """
 Mix service for audio processing and mixing
 """
+import os
+import json
 import logging
+from functools import lru_cache
+from operator import itemgetter
 import asyncio
 import numpy as np
 from pathlib import Path
@@ -11,22 +15,21 @@ from project_memory import get_or_create_project_memory
 from config.settings import MEDIA_DIR
 from utils.dsp.mix_pipeline import process_track, process_master_bus, blend_tracks
 from utils.dsp.load import load_wav
-from utils.dsp.export import save_wav
-from utils.dsp.stereo import stereo_widen
+from utils.dsp.export import save_wav_from_mid_side
 from utils.dsp.scope import compute_scope
 from utils.dsp.streamer import chunk_audio
 from utils.dsp.timing import align_stems  # New DSP utility for alignment
 from utils.dsp.analyze_audio import (
-    compute_waveform,
-    compute_fft_spectrum,
-    compute_levels,
-    compute_energy_curve,
+    compute_visual_bundle,
     compute_track_spectrum,
+    compute_track_spectra,
 )
 from utils.dsp.level import lufs, rms, auto_gain, match_loudness
 from utils.dsp.dynamics import soften_transients, micro_compress, smooth_vocals
+from utils.dsp.fused_dynamics import fused_micro_dynamics
+from utils.dsp.jit import NUMBA_AVAILABLE
 from utils.dsp.tonal_balance import tonal_balance_chain
-from utils.dsp.spatial import spatial_pocket
+from utils.dsp.spatial import spatial_pocket, SPATIAL_ROLES
 from utils.mix.roles import detect_role
 from utils.mix.mix_recipes import MIX_RECIPES
 from utils.mix.config_apply import apply_recipe
@@ -38,6 +41,79 @@ from utils.mix_paths import STORAGE_MIX_OUTPUTS
 
 logger = logging.getLogger(__name__)
 
+# Frequency masking is optional; probe it once at import instead of per mix
+_MASKING_AVAILABLE = False
+try:
+    from utils.dsp.masking import detect_masking, resolve_masking
+    _MASKING_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"⚠️ Frequency masking unavailable: {e}. Beat stems will not be unmasked.")
+
+# Auto-gain loudness targets per role
+_ROLE_TARGETS = {
+    "lead_vocal":  {"lufs": -16, "rms": 0.14},
+    "adlib":       {"lufs": -18, "rms": 0.10},
+    "bass":        {"lufs": -20, "rms": 0.12},
+    "beat":        {"lufs": -18, "rms": 0.13},
+    "default":     {"lufs": -17, "rms": 0.13},
+}
+
+# Map detected roles to auto-gain target roles
+_ROLE_MAP = {
+    "lead": "lead_vocal",
+    "adlib": "adlib",
+    "instrumental": "beat",
+    "double": "default",
+    "harmony": "default",
+    "unknown": "default",
+}
+
+
+# Master bus compressor defaults, overridden by the recipe and then the user
+_MASTER_COMPRESSOR_DEFAULTS = {"threshold": -14, "ratio": 2.0, "attack": 10, "release": 50}
+_master_compressor_fields = itemgetter("threshold", "ratio", "attack", "release")
+
+
+def _to_dict(value) -> dict:
+    """Normalize a Pydantic model, dict or None to a plain dict."""
+    if value is None:
+        return {}
+    if isinstance(value, dict):
+        return value
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "dict"):
+        return value.dict()
+    return {}
+
+
+def _resolve_mastering_config(recipe_name: str, user_master: dict) -> dict:
+    recipe = MIX_RECIPES.get(recipe_name, MIX_RECIPES["default"])
+    master_cfg = _to_dict(recipe.master if hasattr(recipe, "master") else recipe.get("master"))
+    
+    # Compressor defaults, then recipe, then user — merged key by key
+    threshold, ratio, attack, release = _master_compressor_fields({
+        **_MASTER_COMPRESSOR_DEFAULTS,
+        **_to_dict(master_cfg.get("compressor")),
+        **_to_dict(user_master.get("compressor")),
+    })
+    limiter = user_master.get("limiter")
+    limiter = limiter if isinstance(limiter, dict) else {}
+    
+    return {
+        "eq": user_master.get("eq_settings", master_cfg.get("eq", [])),
+        "threshold": threshold,
+        "ratio": ratio,
+        "attack": attack,
+        "release": release,
+        "ceiling": limiter.get("ceiling", master_cfg.get("limiter_threshold", -1.0)),
+    }
+
+
+@lru_cache(maxsize=16)
+def _cached_mastering_config(recipe_name: str, user_master_json: str) -> dict:
+    return _resolve_mastering_config(recipe_name, json.loads(user_master_json))
+
 
 class MixService:
     """Service for handling audio mixing operations"""
@@ -54,71 +130,59 @@ class MixService:
         }
     
     @staticmethod
-    def apply_auto_gain(samples: np.ndarray, role: str) -> np.ndarray:
-        # role-based targets
-        role_targets = {
-            "lead_vocal":  {"lufs": -16, "rms": 0.14},
-            "adlib":       {"lufs": -18, "rms": 0.10},
-            "bass":        {"lufs": -20, "rms": 0.12},
-            "beat":        {"lufs": -18, "rms": 0.13},
-            "default":     {"lufs": -17, "rms": 0.13},
-        }
-        
-        # Map detected roles to target roles
-        role_map = {
-            "lead": "lead_vocal",
-            "adlib": "adlib",
-            "instrumental": "beat",
-            "double": "default",
-            "harmony": "default",
-            "unknown": "default",
-        }
-        
-        mapped_role = role_map.get(role, "default")
-        tgt = role_targets.get(mapped_role, role_targets["default"])
+    def apply_auto_gain(samples: np.ndarray, role: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        tgt = _ROLE_TARGETS[_ROLE_MAP.get(role, "default")]
         gain = auto_gain(samples, tgt["lufs"], tgt["rms"])
-        return samples * gain
+        return np.multiply(samples, gain, out=out)
     
     @staticmethod
-    def apply_micro_dynamics(samples: np.ndarray, role: str) -> np.ndarray:
+    def apply_micro_dynamics(samples: np.ndarray, role: str, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Applies role-sensitive micro-dynamics shaping.
         """
 
+        # (threshold, soften_factor, ratio, smooth_factor) per role group
         # Lead vocals need strongest smoothing
         if role in ["lead_vocal", "lead", "main_vocal"]:
-            samples = soften_transients(samples, threshold=0.12, soften_factor=0.55)
-            samples = micro_compress(samples, ratio=1.4)
-            samples = smooth_vocals(samples, smooth_factor=0.12)
+            params = (0.12, 0.55, 1.4, 0.12)
 
         # Adlibs / backing vocals — lighter treatment
         elif role in ["adlib", "backing_vocal"]:
-            samples = soften_transients(samples, threshold=0.14, soften_factor=0.65)
-            samples = micro_compress(samples, ratio=1.25)
-            samples = smooth_vocals(samples, smooth_factor=0.08)
+            params = (0.14, 0.65, 1.25, 0.08)
 
-        # Beat elements — protect punch
+        # Beat elements — protect punch (no smoothing)
         elif role in ["beat", "drums", "kick", "snare", "hi_hat"]:
-            samples = soften_transients(samples, threshold=0.20, soften_factor=0.8)
-            samples = micro_compress(samples, ratio=1.15)
+            params = (0.20, 0.8, 1.15, 0.0)
 
         # Default
         else:
-            samples = soften_transients(samples, threshold=0.16, soften_factor=0.7)
-            samples = micro_compress(samples, ratio=1.2)
+            params = (0.16, 0.7, 1.2, 0.0)
+
+        threshold, soften_factor, ratio, smooth_factor = params
+
+        if NUMBA_AVAILABLE:
+            # One fused pass per channel instead of three full-buffer stages
+            return fused_micro_dynamics(samples, threshold, soften_factor, ratio, smooth_factor, out=out)
+
+        samples = soften_transients(samples, threshold=threshold, soften_factor=soften_factor, out=out)
+        samples = micro_compress(samples, ratio=ratio, out=out)
+        if smooth_factor:
+            samples = smooth_vocals(samples, smooth_factor=smooth_factor, out=out)
 
         return samples
     
     @staticmethod
-    def apply_tonal_balance(samples: np.ndarray, role: str) -> np.ndarray:
+    def apply_tonal_balance(samples: np.ndarray, role: str, out: Optional[np.ndarray] = None) -> np.ndarray:
         try:
-            return tonal_balance_chain(samples, role)
+            return tonal_balance_chain(samples, role, out=out)
         except Exception as e:
             logging.error(f"Tonal balance failed: {e}")
             return samples
     
     @staticmethod
     def apply_spatial_separation(stereo_samples: np.ndarray, role: str):
+        if role not in SPATIAL_ROLES:
+            return stereo_samples
         try:
             return spatial_pocket(stereo_samples, role)
         except Exception as e:
@@ -127,14 +191,153 @@ class MixService:
     
     @staticmethod
     def apply_frequency_masking(vocal_samples, beat_samples):
+        if not _MASKING_AVAILABLE:
+            return beat_samples
         try:
-            from utils.dsp.masking import detect_masking, resolve_masking
             masked_freqs = detect_masking(vocal_samples, beat_samples)
+            if masked_freqs.size == 0:
+                return beat_samples
             return resolve_masking(beat_samples, masked_freqs)
         except Exception as e:
             logging.error(f"Frequency masking failed: {e}")
             return beat_samples
     
+    @staticmethod
+    def _resolve_stem_path(stem_path: str) -> str:
+        """Map a stem URL/path to a path relative to the working directory."""
+        if stem_path.startswith("/media/"):
+            return "." + stem_path
+        if not stem_path.startswith("./"):
+            return "./" + stem_path.lstrip("/")
+        return stem_path
+    
+    @staticmethod
+    def _missing_stems(resolved_paths: Dict[str, str]) -> list:
+        """Return the names of stems whose resolved file does not exist."""
+        return [stem_name for stem_name, path in resolved_paths.items() if not os.path.isfile(path)]
+    
+    @staticmethod
+    def _process_one_stem(stem_name: str, audio_data: np.ndarray, stems: Dict[str, str], config: Optional[Dict[str, Any]], emit_realtime: bool = True):
+        """
+        Run one stem's DSP chain (auto gain through process_track) plus its
+        streaming chunks. Stems are independent, so mix() runs this for
+        every stem concurrently in worker threads.
+        
+        Returns:
+            (processed_audio, meter_data, track_chunks);
+            chunks are None when emit_realtime is False
+        """
+        default_track_config = {
+            "eq_settings": [],
+            "compressor": None,
+            "saturation": None,
+            "gain_db": 0.0
+        }
+        
+        # Get track config (from config parameter or use defaults)
+        track_config_raw = default_track_config.copy()
+        if config and "track_configs" in config and stem_name in config.get("track_configs", {}):
+            track_config_raw.update(config["track_configs"][stem_name])
+        
+        # Detect role from filename
+        filename = stems[stem_name]
+        role = detect_role(filename)
+        track_config_raw["role"] = role
+        
+        # One scratch buffer per stem, reused by auto gain, micro-dynamics and tonal balance
+        scratch = np.empty_like(audio_data)
+        
+        # === AI AUTO GAIN (PRE-DSP) ===
+        gain_role = role  # Default to detected role
+        if config:
+            if hasattr(config, "tracks"):
+                track_cfg = config.tracks.get(stem_name) or {}
+                gain_role = track_cfg.get("role") if isinstance(track_cfg, dict) else (getattr(track_cfg, "role", None) or role)
+            else:
+                track_cfg = config.get("tracks", {}).get(stem_name, {})
+                gain_role = track_cfg.get("role", role)
+        
+        try:
+            audio_data = MixService.apply_auto_gain(audio_data, gain_role, out=scratch)
+        except Exception as e:
+            logging.error(f"DSP step failed: {e}")
+            # Continue with original audio_data if auto gain fails
+        # === END AI AUTO GAIN ===
+        
+        # === MICRO-DYNAMICS (AFTER GAIN, BEFORE EQ) ===
+        try:
+            audio_data = MixService.apply_micro_dynamics(audio_data, role, out=scratch)
+        except Exception as e:
+            logging.error(f"DSP step failed: {e}")
+            # Continue with original audio_data if micro-dynamics fails
+        # === END MICRO-DYNAMICS ===
+        
+        # === TONAL BALANCE (AFTER MICRO-DYNAMICS, BEFORE EQ) ===
+        # apply_tonal_balance logs and falls back to its input on failure
+        audio_data = MixService.apply_tonal_balance(audio_data, role, out=scratch)
+        # === END TONAL BALANCE ===
+        
+        # === SPATIAL SEPARATION (AFTER TONAL BALANCE, BEFORE EQ) ===
+        if role in SPATIAL_ROLES:
+            # spatial_pocket works on [2, N]: hand it a view of the [N, 2] stem
+            # (mono is broadcast to two channels without copying)
+            if audio_data.ndim == 1:
+                stereo = np.broadcast_to(audio_data, (2, audio_data.shape[0]))
+            else:
+                stereo = audio_data.T
+            
+            # apply_spatial_separation logs and falls back to its input on failure
+            stereo = MixService.apply_spatial_separation(stereo, role)
+            
+            # Back to [N, 2] float32 for downstream DSP
+            audio_data = np.ascontiguousarray(stereo.T, dtype=np.float32)
+        # === END SPATIAL SEPARATION ===
+        
+        # Adapt config format for new DSP functions
+        track_config = {
+            "role": role,
+            "eq": track_config_raw.get("eq_settings", []),
+            "compressor": track_config_raw.get("compressor", {}),
+            "saturation": track_config_raw.get("saturation", {}).get("amount", 0.0) if isinstance(track_config_raw.get("saturation"), dict) else (track_config_raw.get("saturation") if isinstance(track_config_raw.get("saturation"), (int, float)) else 0.0),
+            "gain": track_config_raw.get("gain_db", 0.0)
+        }
+        
+        # Apply per-track DSP chain
+        processed_data, meter_data = process_track(audio_data, track_config)
+        if not emit_realtime:
+            return processed_data, meter_data, None
+        
+        # Generate per-track streaming chunks
+        track_chunks = chunk_audio(processed_data)
+        
+        return processed_data, meter_data, track_chunks
+    
+    @staticmethod
+    def _build_mastering_config(config) -> dict:
+        """
+        Flatten the selected mix recipe's master settings and the user's
+        mastering overrides into the dict process_master_bus expects.
+        Resolved configs are memoized per (recipe name, user overrides).
+        """
+        if config and hasattr(config, "project_settings"):
+            project_settings = config.project_settings or {}
+        else:
+            project_settings = config.get("project_settings", {}) if config else {}
+        recipe_name = project_settings.get("mix_recipe", "default")
+        
+        # Recipe takes precedence, but allow user overrides
+        if config and hasattr(config, "master"):
+            user_master = _to_dict(config.master)
+        else:
+            user_master = _to_dict(config.get("mastering_config") if config else None)
+        
+        try:
+            user_master_key = json.dumps(user_master, sort_keys=True)
+        except (TypeError, ValueError):
+            # Not JSON-serializable, so not cacheable: resolve directly
+            return _resolve_mastering_config(recipe_name, user_master)
+        return dict(_cached_mastering_config(recipe_name, user_master_key))
+    
     @staticmethod
     async def mix(session_id: str, stems: Dict[str, str], config: Optional[Dict[str, Any]] = None, job_id: Optional[str] = None) -> dict:
         """
@@ -155,43 +358,38 @@ class MixService:
             if not stems:
                 return {"error": "No stems provided", "is_error": True}
             
-            # Validate stem files exist
-            for stem_name, stem_path in stems.items():
-                stem_path_obj = Path(stem_path)
-                if stem_path.startswith("/media/"):
-                    stem_path_obj = Path("." + stem_path)
-                elif not stem_path.startswith("./"):
-                    stem_path_obj = Path("./" + stem_path.lstrip("/"))
-                
-                exists = await asyncio.to_thread(stem_path_obj.exists)
-                if not exists:
-                    return {"error": f"Stem file not found: {stem_name} at {stem_path}", "is_error": True}
+            # Resolve every stem path once
+            resolved_paths = {stem_name: MixService._resolve_stem_path(stem_path) for stem_name, stem_path in stems.items()}
+            
+            # Validate stem files exist (one worker-thread hop for all stems)
+            missing = await asyncio.to_thread(MixService._missing_stems, resolved_paths)
+            if missing:
+                stem_name = missing[0]
+                return {"error": f"Stem file not found: {stem_name} at {stems[stem_name]}", "is_error": True}
             
             # Loading stems
             if job_id:
                 MixJobManager.update(job_id, state="loading_stems", progress=10, message="Loading stems…")
-                await asyncio.sleep(0.05)
+                await asyncio.sleep(0)
+            
+            # Load audio files using load_wav, all stems concurrently
+            load_tasks = {
+                stem_name: asyncio.to_thread(load_wav, resolved_path)
+                for stem_name, resolved_path in resolved_paths.items()
+            }
             
-            # Load audio files using load_wav
+            loaded = await asyncio.gather(*load_tasks.values(), return_exceptions=True)
             audio_data_dict = {}
-            for stem_name, stem_path in stems.items():
-                # Resolve path
-                resolved_path = stem_path
-                if stem_path.startswith("/media/"):
-                    resolved_path = "." + stem_path
-                elif not stem_path.startswith("./"):
-                    resolved_path = "./" + stem_path.lstrip("/")
-                
-                try:
-                    audio_data = await asyncio.to_thread(load_wav, resolved_path)
-                    audio_data_dict[stem_name] = audio_data
-                except Exception as e:
-                    return {"error": f"Could not load audio file: {stem_name} - {str(e)}", "is_error": True}
+            for stem_name, audio_data in zip(load_tasks, loaded):
+                if isinstance(audio_data, Exception):
+                    return {"error": f"Could not load audio file: {stem_name} - {str(audio_data)}", "is_error": True}
+                # Pin the whole pipeline to contiguous float32 at ingest
+                audio_data_dict[stem_name] = np.ascontiguousarray(audio_data, dtype=np.float32)
             
             # Aligning stems
             if job_id:
                 MixJobManager.update(job_id, state="aligning_stems", progress=25, message="Aligning stems…")
-                await asyncio.sleep(0.05) 
+                await asyncio.sleep(0)
 
             # === IMPLEMENTATION: STEM ALIGNMENT ===
             # Note: align_stems will detect the onset difference between the "beat" and "vocal" stems
@@ -208,7 +406,7 @@ class MixService:
             # Processing track DSP
             if job_id:
                 MixJobManager.update(job_id, state="processing_tracks", progress=50, message="Applying DSP…")
-                await asyncio.sleep(0.05)
+                await asyncio.sleep(0)
             
             # Get config from job if available, otherwise use passed config
             if job_id:
@@ -218,114 +416,40 @@ class MixService:
                 elif job and job.extra.get("config"):
                     config = job.extra.get("config")
             
-            # Process per-track DSP chain
+            # Spectra, scopes and stream chunks are only consumed through job.extra
+            emit_realtime = bool(job_id) and JOBS.get(job_id) is not None
+            
+            # Process per-track DSP chain; stems are independent, so run them concurrently
+            stem_results = await asyncio.gather(*(
+                asyncio.to_thread(MixService._process_one_stem, stem_name, audio_data, stems, config, emit_realtime)
+                for stem_name, audio_data in audio_data_dict.items()
+            ))
+            
             processed_tracks = {}  # Store as dict keyed by stem_name
             track_meters = {}
             track_spectra = {}
             track_streams = {}
-            default_track_config = {
-                "eq_settings": [],
-                "compressor": None,
-                "saturation": None,
-                "gain_db": 0.0
-            }
-            
-            for stem_name, audio_data in audio_data_dict.items():
-                
-                # Get track config (from config parameter or use defaults)
-                track_config_raw = default_track_config.copy()
-                if config and "track_configs" in config and stem_name in config.get("track_configs", {}):
-                    track_config_raw.update(config["track_configs"][stem_name])
-                
-                # Detect role from filename
-                filename = stems[stem_name]
-                role = detect_role(filename)
-                track_config_raw["role"] = role
-                
-                # === AI AUTO GAIN (PRE-DSP) ===
-                gain_role = role  # Default to detected role
-                if config:
-                    if hasattr(config, "tracks"):
-                        track_cfg = config.tracks.get(stem_name) or {}
-                        gain_role = track_cfg.get("role") if isinstance(track_cfg, dict) else (getattr(track_cfg, "role", None) or role)
-                    else:
-                        track_cfg = config.get("tracks", {}).get(stem_name, {})
-                        gain_role = track_cfg.get("role", role)
-                
-                try:
-                    audio_data = MixService.apply_auto_gain(audio_data, gain_role)
-                except Exception as e:
-                    logging.error(f"DSP step failed: {e}")
-                    # Continue with original audio_data if auto gain fails
-                # === END AI AUTO GAIN ===
-                
-                # === MICRO-DYNAMICS (AFTER GAIN, BEFORE EQ) ===
-                try:
-                    audio_data = MixService.apply_micro_dynamics(audio_data, role)
-                except Exception as e:
-                    logging.error(f"DSP step failed: {e}")
-                    # Continue with original audio_data if micro-dynamics fails
-                # === END MICRO-DYNAMICS ===
-                
-                # === TONAL BALANCE (AFTER MICRO-DYNAMICS, BEFORE EQ) ===
-                try:
-                    audio_data = MixService.apply_tonal_balance(audio_data, role)
-                except Exception as e:
-                    logging.error(f"DSP step failed: {e}")
-                    # Continue with original audio_data if tonal balance fails
-                # === END TONAL BALANCE ===
-                
-                # === SPATIAL SEPARATION (AFTER TONAL BALANCE, BEFORE EQ) ===
-                try:
-                    # Convert mono to [2, N] stereo placeholder if needed
-                    if audio_data.ndim == 1:
-                        stereo = np.vstack([audio_data, audio_data])
-                    else:
-                        stereo = audio_data
-                    
-                    stereo = MixService.apply_spatial_separation(stereo, role)
-                    
-                    # Keep stereo for downstream DSP
-                    audio_data = stereo
-                except Exception as e:
-                    logging.error(f"DSP step failed: {e}")
-                    # Continue with original audio_data if spatial separation fails
-                # === END SPATIAL SEPARATION ===
-                
-                # Adapt config format for new DSP functions
-                track_config = {
-                    "role": role,
-                    "eq": track_config_raw.get("eq_settings", []),
-                    "compressor": track_config_raw.get("compressor", {}),
-                    "saturation": track_config_raw.get("saturation", {}).get("amount", 0.0) if isinstance(track_config_raw.get("saturation"), dict) else (track_config_raw.get("saturation") if isinstance(track_config_raw.get("saturation"), (int, float)) else 0.0),
-                    "gain": track_config_raw.get("gain_db", 0.0)
-                }
-                
-                # Apply per-track DSP chain
-                processed_data, meter_data = process_track(audio_data, track_config)
+            for stem_name, (processed_data, meter_data, track_chunks) in zip(audio_data_dict, stem_results):
                 processed_tracks[stem_name] = processed_data
                 track_meters[stem_name] = meter_data
-                track_spectra[stem_name] = compute_track_spectrum(processed_data)
-                
-                # Generate per-track streaming chunks
-                track_chunks = chunk_audio(processed_data)
                 track_streams[stem_name] = track_chunks
             
+            # Per-track spectra in one batched FFT across stems
+            if emit_realtime:
+                spectra = await asyncio.to_thread(compute_track_spectra, list(processed_tracks.values()))
+                track_spectra = dict(zip(processed_tracks, spectra))
+            
             # Apply masking AFTER track DSP
-            if "lead" in processed_tracks and "beat" in processed_tracks:
-                try:
-                    resolved = MixService.apply_frequency_masking(
-                        processed_tracks["lead"],
-                        processed_tracks["beat"]
-                    )
-                    processed_tracks["beat"] = resolved
-                except Exception as e:
-                    logging.error(f"Masking failed: {e}")
+            if _MASKING_AVAILABLE and "lead" in processed_tracks and "beat" in processed_tracks:
+                processed_tracks["beat"] = MixService.apply_frequency_masking(
+                    processed_tracks["lead"],
+                    processed_tracks["beat"]
+                )
             
             # Mixing
             if job_id:
                 MixJobManager.update(job_id, state="mixing", progress=65, message="Blending tracks…")
-                await asyncio.sleep(0.05)
+                await asyncio.sleep(0)
             
             # Blend tracks (convert dict to list)
             blended_audio = blend_tracks(list(processed_tracks.values()))
@@ -340,136 +464,89 @@ class MixService:
                 # Continue with original blended_audio if normalization fails
             # === END MASTER NORMALIZATION ===
             
-            # Generate pre-master streaming chunks
-            pre_master_chunks = chunk_audio(blended_audio)
-            
-            pre_master_scope = compute_scope(blended_audio)
-            
-            # Compute pre-master spectrum
-            pre_master_spectrum = compute_track_spectrum(blended_audio)
+            # Pre-master scope, spectrum and streaming chunks only read blended_audio,
+            # so run them in worker threads while the master chain is processing
+            if emit_realtime:
+                pre_master_analysis = asyncio.gather(
+                    asyncio.to_thread(compute_scope, blended_audio),
+                    asyncio.to_thread(compute_track_spectrum, blended_audio),
+                    asyncio.to_thread(chunk_audio, blended_audio),
+                )
             
             # Apply mix recipe to master bus
-            if config and hasattr(config, "project_settings"):
-                project_settings = config.project_settings or {}
-            else:
-                project_settings = config.get("project_settings", {}) if config else {}
-            
-            recipe = MIX_RECIPES.get(project_settings.get("mix_recipe", "default"), MIX_RECIPES["default"])
-            
-            # Handle recipe as Pydantic model or dict
-            if hasattr(recipe, "master"):
-                master_cfg = recipe.master
-                # Convert Pydantic to dict if needed
-                if hasattr(master_cfg, "model_dump"):
-                    master_cfg_dict = master_cfg.model_dump()
-                elif hasattr(master_cfg, "dict"):
-                    master_cfg_dict = master_cfg.dict()
-                else:
-                    master_cfg_dict = master_cfg
-            else:
-                master_cfg_dict = recipe.get("master", {})
-            
-            # Extract values from master_cfg_dict (handle nested Pydantic models)
-            recipe_eq = master_cfg_dict.get("eq", []) if isinstance(master_cfg_dict, dict) else (getattr(master_cfg, "eq", []) if hasattr(master_cfg, "eq") else [])
-            recipe_compressor = master_cfg_dict.get("compressor") if isinstance(master_cfg_dict, dict) else (getattr(master_cfg, "compressor", None) if hasattr(master_cfg, "compressor") else None)
-            recipe_limiter_threshold = master_cfg_dict.get("limiter_threshold", -1.0) if isinstance(master_cfg_dict, dict) else (getattr(master_cfg, "limiter_threshold", -1.0) if hasattr(master_cfg, "limiter_threshold") else -1.0)
-            
-            # Convert compressor to dict if it's a Pydantic model
-            if recipe_compressor and not isinstance(recipe_compressor, dict):
-                if hasattr(recipe_compressor, "model_dump"):
-                    recipe_compressor = recipe_compressor.model_dump()
-                elif hasattr(recipe_compressor, "dict"):
-                    recipe_compressor = recipe_compressor.dict()
-            
-            # Apply mastering chain - adapt config format (recipe takes precedence, but allow user overrides)
-            if config and hasattr(config, "master"):
-                mastering_config_raw = config.master
-                if hasattr(mastering_config_raw, "model_dump"):
-                    mastering_config_raw = mastering_config_raw.model_dump()
-                elif hasattr(mastering_config_raw, "dict"):
-                    mastering_config_raw = mastering_config_raw.dict()
-            else:
-                mastering_config_raw = config.get("mastering_config", {}) if config else {}
-            
-            # Extract compressor settings
-            user_compressor = mastering_config_raw.get("compressor", {}) if isinstance(mastering_config_raw, dict) else {}
-            if user_compressor and not isinstance(user_compressor, dict):
-                if hasattr(user_compressor, "model_dump"):
-                    user_compressor = user_compressor.model_dump()
-                elif hasattr(user_compressor, "dict"):
-                    user_compressor = user_compressor.dict()
-            
-            mastering_config = {
-                "eq": mastering_config_raw.get("eq_settings", recipe_eq) if isinstance(mastering_config_raw, dict) else recipe_eq,
-                "threshold": user_compressor.get("threshold", recipe_compressor.get("threshold", -14)) if isinstance(user_compressor, dict) else (recipe_compressor.get("threshold", -14) if isinstance(recipe_compressor, dict) else -14),
-                "ratio": user_compressor.get("ratio", recipe_compressor.get("ratio", 2.0)) if isinstance(user_compressor, dict) else (recipe_compressor.get("ratio", 2.0) if isinstance(recipe_compressor, dict) else 2.0),
-                "attack": user_compressor.get("attack", recipe_compressor.get("attack", 10)) if isinstance(user_compressor, dict) else (recipe_compressor.get("attack", 10) if isinstance(recipe_compressor, dict) else 10),
-                "release": user_compressor.get("release", recipe_compressor.get("release", 50)) if isinstance(user_compressor, dict) else (recipe_compressor.get("release", 50) if isinstance(recipe_compressor, dict) else 50),
-                "ceiling": mastering_config_raw.get("limiter", {}).get("ceiling", recipe_limiter_threshold) if isinstance(mastering_config_raw, dict) and isinstance(mastering_config_raw.get("limiter"), dict) else recipe_limiter_threshold
-            }
+            mastering_config = MixService._build_mastering_config(config)
             # Mastering
             if job_id:
                 MixJobManager.update(job_id, state="mastering", progress=80, message="Applying master chain…")
-                await asyncio.sleep(0.05)
-            
-            mastered_audio, master_meter = process_master_bus(blended_audio, mastering_config)
-            
-            # Generate post-master streaming chunks
-            post_master_chunks = chunk_audio(mastered_audio)
+                await asyncio.sleep(0)
             
-            post_master_scope = compute_scope(mastered_audio)
-            
-            # Compute post-master spectrum
-            post_master_spectrum = compute_track_spectrum(mastered_audio)
-            
-            # Apply stereo widening to final master
-            master_audio = stereo_widen(mastered_audio, amount=0.15)
-            
-            # Compute visual data
-            visual = {
-                "waveform": compute_waveform(master_audio),
-                "spectrum": compute_fft_spectrum(master_audio),
-                "levels": compute_levels(master_audio),
-                "energy_curve": compute_energy_curve(master_audio),
-            }
+            try:
+                mastered_audio, master_meter = await asyncio.to_thread(process_master_bus, blended_audio, mastering_config)
+            except BaseException:
+                if emit_realtime:
+                    # Settle the in-flight analysis so its outcome isn't reported as never retrieved
+                    pre_master_analysis.cancel()
+                    await asyncio.gather(pre_master_analysis, return_exceptions=True)
+                raise
+            if emit_realtime:
+                pre_master_scope, pre_master_spectrum, pre_master_chunks = await pre_master_analysis
+                
+                # Post-master scope, spectrum and streaming chunks
+                post_master_scope, post_master_spectrum, post_master_chunks = await asyncio.gather(
+                    asyncio.to_thread(compute_scope, mastered_audio),
+                    asyncio.to_thread(compute_track_spectrum, mastered_audio),
+                    asyncio.to_thread(chunk_audio, mastered_audio),
+                )
             
-            # Store visual data in job.extra
-            if job_id:
-                MixJobManager.update(job_id, message="Visual data computed")
-                job = JOBS.get(job_id)
-                if job:
-                    job.extra["visual"] = visual
-                    job.extra.setdefault("realtime_meters", {})
-                    job.extra["realtime_meters"]["tracks"] = track_meters
-                    job.extra["realtime_meters"]["master"] = master_meter
-                    job.extra.setdefault("realtime_spectra", {})
-                    job.extra["realtime_spectra"]["tracks"] = track_spectra
-                    job.extra["realtime_spectra"]["pre_master"] = pre_master_spectrum
-                    job.extra["realtime_spectra"]["post_master"] = post_master_spectrum
-                    job.extra.setdefault("realtime_scope", {})
-                    job.extra["realtime_scope"]["tracks"] = {
-                        stem_name: meter_data.get("scope")
-                        for stem_name, meter_data in track_meters.items()
-                    }
-                    job.extra["realtime_scope"]["pre_master"] = pre_master_scope
-                    job.extra["realtime_scope"]["post_master"] = post_master_scope
-                    job.extra.setdefault("realtime_stream", {})
-                    job.extra["realtime_stream"]["pre_master"] = pre_master_chunks
-                    job.extra["realtime_stream"]["post_master"] = post_master_chunks
-                    job.extra["realtime_stream"]["tracks"] = track_streams
+            # Stereo widening of the final master is fused into the WAV export below
+            master_audio = mastered_audio
             
             # Exporting
             if job_id:
                 MixJobManager.update(job_id, state="exporting", progress=90, message="Exporting final mix…")
-                await asyncio.sleep(0.05)
+                await asyncio.sleep(0)
             
             # Ensure output directory exists
             output_dir = STORAGE_MIX_OUTPUTS / session_id
             output_dir.mkdir(parents=True, exist_ok=True)
             output_path = output_dir / "final_mix.wav"
             
-            # Export as WAV using save_wav
-            await asyncio.to_thread(save_wav, str(output_path), master_audio)
+            # Visual data (single mono downmix shared by all four visuals) and the
+            # WAV export (stereo field widened on the way out) only read master_audio,
+            # so the disk write overlaps the analysis
+            visual, _ = await asyncio.gather(
+                asyncio.to_thread(compute_visual_bundle, master_audio),
+                asyncio.to_thread(save_wav_from_mid_side, str(output_path), master_audio, 0.15),
+            )
+            
+            # Collect realtime data locally; it is written to job.extra once,
+            # with the final job update, so the large payload is serialized a single time
+            if emit_realtime:
+                extra_updates = {
+                    "visual": visual,
+                    "realtime_meters": {
+                        "tracks": track_meters,
+                        "master": master_meter,
+                    },
+                    "realtime_spectra": {
+                        "tracks": track_spectra,
+                        "pre_master": pre_master_spectrum,
+                        "post_master": post_master_spectrum,
+                    },
+                    "realtime_scope": {
+                        "tracks": {
+                            stem_name: meter_data.get("scope")
+                            for stem_name, meter_data in track_meters.items()
+                        },
+                        "pre_master": pre_master_scope,
+                        "post_master": post_master_scope,
+                    },
+                    "realtime_stream": {
+                        "pre_master": pre_master_chunks,
+                        "post_master": post_master_chunks,
+                        "tracks": track_streams,
+                    },
+                }
             
             # Store duration for transport system
             if job_id:
@@ -479,8 +556,15 @@ class MixService:
             
             # Complete
             if job_id:
+                job = JOBS.get(job_id) if emit_realtime else None
+                if job:
+                    for key, value in extra_updates.items():
+                        if isinstance(value, dict):
+                            job.extra.setdefault(key, {}).update(value)
+                        else:
+                            job.extra[key] = value
                 MixJobManager.update(job_id, state="complete", progress=100, message="Mix complete.")
-                await asyncio.sleep(0.05)
+                await asyncio.sleep(0)
             
             # Return URL
             final_url = f"/storage/mix_outputs/{session_id}/final_mix.wav"
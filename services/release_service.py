@@ -2,9 +2,17 @@
 Clean ReleaseService V5 - project_id only
 """
 
+import io
+import os
 import json
+import mmap
+import uuid
+import shutil
+import hashlib
+import asyncio
 import zipfile
 import logging
+import aiofiles
 from pathlib import Path
 from fastapi import UploadFile
 
@@ -12,6 +20,54 @@ from config.settings import MEDIA_DIR
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _dump_json(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+# Already-compressed (or barely compressible) payloads are stored as-is;
+# deflating them costs CPU for no size win
+_STORED_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".pdf", ".wav", ".mp3", ".zip"})
+
+# Copy buffer for streaming assets into the archive
+_ZIP_COPY_CHUNK = 1 << 20
+
+# Assets above this size are memory-mapped instead of copied through a buffer
+_ZIP_MMAP_THRESHOLD = 16 << 20
+
+# Read size when streaming an upload to disk
+_UPLOAD_CHUNK = 1 << 20
+
+# Largest accepted cover upload
+_MAX_COVER_BYTES = 10 << 20
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only, unseekable sink that hands zipfile output back in pieces.
+    zipfile falls back to data descriptors when it cannot seek, so the
+    archive can be streamed front to back.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
 class ReleaseService:
     """
@@ -30,8 +86,29 @@ class ReleaseService:
         try:
             project_path = self._project_path(project_id)
             cover_path = project_path / "cover.jpg"
-            with open(cover_path, "wb") as f:
-                f.write(await file.read())
+            too_large = ValueError(f"Cover exceeds {_MAX_COVER_BYTES >> 20} MB limit")
+
+            # Reject up front when the size is already known
+            size = getattr(file, "size", None)
+            if size is not None and size > _MAX_COVER_BYTES:
+                raise too_large
+
+            # Stream the upload into a temp file beside the cover, so a rejected
+            # or failed upload never touches the cover already saved
+            tmp_path = project_path / f".cover.jpg.{uuid.uuid4().hex}.tmp"
+            try:
+                written = 0
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    while chunk := await file.read(_UPLOAD_CHUNK):
+                        written += len(chunk)
+                        if written > _MAX_COVER_BYTES:
+                            raise too_large
+                        await f.write(chunk)
+                os.replace(tmp_path, cover_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
             return {"data": str(cover_path), "is_error": False}
         except Exception as e:
             logger.error(f"Failed to save cover: {e}", exc_info=True)
@@ -41,8 +118,8 @@ class ReleaseService:
         try:
             project_path = self._project_path(project_id)
             copy_path = project_path / "release_description.txt"
-            with open(copy_path, "w", encoding="utf-8") as f:
-                f.write(text)
+            async with aiofiles.open(copy_path, "w", encoding="utf-8") as f:
+                await f.write(text)
             return {"data": str(copy_path), "is_error": False}
         except Exception as e:
             logger.error(f"Failed to save release copy: {e}", exc_info=True)
@@ -52,8 +129,8 @@ class ReleaseService:
         try:
             project_path = self._project_path(project_id)
             pdf_path = project_path / "lyrics.pdf"
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_bytes)
+            async with aiofiles.open(pdf_path, "wb") as f:
+                await f.write(pdf_bytes)
             return {"data": str(pdf_path), "is_error": False}
         except Exception as e:
             logger.error(f"Failed to save lyrics PDF: {e}", exc_info=True)
@@ -63,23 +140,132 @@ class ReleaseService:
         try:
             project_path = self._project_path(project_id)
             metadata_path = project_path / "metadata.json"
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2)
+            async with aiofiles.open(metadata_path, "wb") as f:
+                await f.write(_dump_json(metadata))
             return {"data": str(metadata_path), "is_error": False}
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}", exc_info=True)
             return {"error": str(e), "is_error": True}
 
+    @staticmethod
+    def _release_entries(project_path: Path, zip_name: str):
+        # One scandir pass; is_file() comes from the dirent type, so
+        # subdirectories are skipped without an extra stat per entry.
+        # Never archive the pack into itself, or an in-flight temp upload.
+        with os.scandir(project_path) as entries:
+            return sorted(
+                (
+                    entry for entry in entries
+                    if entry.is_file() and entry.name != zip_name and not entry.name.startswith(".")
+                ),
+                key=lambda entry: entry.name,
+            )
+
+    @staticmethod
+    def _release_digest(entries) -> bytes:
+        """
+        Cache key for the pack: BLAKE2b over (name, mtime_ns, size) of
+        every asset, so any upload or overwrite invalidates it.
+        """
+        manifest = hashlib.blake2b(digest_size=16)
+        for entry in entries:
+            st = entry.stat()
+            manifest.update(f"{entry.name}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        return manifest.hexdigest().encode()
+
+    @staticmethod
+    def _zip_is_current(zip_path: Path, digest: bytes) -> bool:
+        # The digest lives in the archive comment; reading it only parses
+        # the end-of-central-directory record
+        try:
+            with zipfile.ZipFile(zip_path) as z:
+                return z.comment == digest
+        except (OSError, zipfile.BadZipFile):
+            return False
+
+    @staticmethod
+    def _is_stored(entry) -> bool:
+        return os.path.splitext(entry.name)[1].lower() in _STORED_SUFFIXES
+
+    @staticmethod
+    def _deflate_entry(z: zipfile.ZipFile, entry):
+        # Text assets (metadata, lyrics) are small; level 1 keeps deflate cheap
+        z.write(entry.path, arcname=entry.name, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+
+    @classmethod
+    def _write_release_zip(cls, project_path: Path, zip_path: Path):
+        entries = cls._release_entries(project_path, zip_path.name)
+        digest = cls._release_digest(entries)
+
+        # Assets unchanged since the last build: reuse the existing pack
+        if cls._zip_is_current(zip_path, digest):
+            return
+
+        with zipfile.ZipFile(zip_path, "w") as z:
+            z.comment = digest
+            for entry in entries:
+                if not cls._is_stored(entry):
+                    cls._deflate_entry(z, entry)
+                    continue
+
+                info = zipfile.ZipInfo.from_file(entry.path, arcname=entry.name)
+                with open(entry.path, "rb") as src, z.open(info, "w", force_zip64=True) as dst:
+                    if info.file_size > _ZIP_MMAP_THRESHOLD:
+                        # Large stems: CRC and write read straight from the page cache
+                        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            dst.write(mm)
+                    else:
+                        # Stream in 1 MiB pieces; zipfile updates the CRC per chunk,
+                        # so a file never has to sit in memory whole
+                        shutil.copyfileobj(src, dst, _ZIP_COPY_CHUNK)
+
     async def generate_release_zip(self, project_id: str):
         try:
             project_path = self._project_path(project_id)
             zip_path = project_path / f"{project_id}_release_pack.zip"
 
-            with zipfile.ZipFile(zip_path, "w") as z:
-                for file in project_path.glob("*"):
-                    z.write(file, arcname=file.name)
+            # Zip building is blocking file I/O; keep it off the event loop
+            await asyncio.to_thread(self._write_release_zip, project_path, zip_path)
 
             return {"data": str(zip_path), "is_error": False}
         except Exception as e:
             logger.error(f"Failed to generate release zip: {e}", exc_info=True)
             return {"error": str(e), "is_error": True}
+
+    def iter_release_pack(self, project_id: str):
+        """
+        Return a generator of the release pack as zip bytes, without
+        writing it to disk. Raises FileNotFoundError for an unknown
+        project before any byte is produced, so callers can answer 404.
+        """
+        project_dir = Path(MEDIA_DIR) / project_id
+        if not project_dir.is_dir():
+            raise FileNotFoundError(f"Project not found: {project_id}")
+
+        return self._stream_release_pack(project_dir / "release", f"{project_id}_release_pack.zip")
+
+    def _stream_release_pack(self, project_path: Path, zip_name: str):
+        # Synchronous on purpose: StreamingResponse runs it in the
+        # threadpool, so file reads and deflate stay off the event loop
+        entries = self._release_entries(project_path, zip_name) if project_path.is_dir() else []
+        sink = _ChunkSink()
+
+        with zipfile.ZipFile(sink, "w") as z:
+            for entry in entries:
+                if not self._is_stored(entry):
+                    self._deflate_entry(z, entry)
+                    yield sink.drain()
+                    continue
+
+                info = zipfile.ZipInfo.from_file(entry.path, arcname=entry.name)
+                with open(entry.path, "rb") as src, z.open(info, "w", force_zip64=True) as dst:
+                    while chunk := src.read(_ZIP_COPY_CHUNK):
+                        dst.write(chunk)
+                        data = sink.drain()
+                        if data:
+                            yield data
+                # Data descriptor for the member just closed
+                yield sink.drain()
+
+        # Central directory
+        yield sink.drain()
@@ -3,11 +3,40 @@ Replicate song generation service using YuE model
 """
 import os
 import logging
+from functools import lru_cache
 from typing import Optional
 import replicate
 
 logger = logging.getLogger(__name__)
 
+_AUDIO_SUFFIXES = (".mp3", ".wav", ".flac", ".m4a")
+_AUDIO_OUTPUT_KEYS = ("audio", "output", "files", "url", "file")
+
+
+@lru_cache(maxsize=1)
+def _replicate_client(api_token: str) -> replicate.Client:
+    """One client per token, so calls reuse its HTTP connection pool"""
+    return replicate.Client(api_token=api_token)
+
+
+def _first_audio_url(output) -> Optional[str]:
+    """
+    Depth-first walk of a model output (a URL string, or lists/dicts of
+    them) returning the first audio URL. Dict keys are tried in
+    _AUDIO_OUTPUT_KEYS order.
+    """
+    stack = [output]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            if item.endswith(_AUDIO_SUFFIXES):
+                return item
+        elif isinstance(item, dict):
+            stack.extend(reversed([item[key] for key in _AUDIO_OUTPUT_KEYS if key in item]))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+    return None
+
 
 async def replicate_generate_song_yue(lyrics: str, style: Optional[str] = None) -> str:
     """
@@ -28,7 +57,7 @@ async def replicate_generate_song_yue(lyrics: str, style: Optional[str] = None)
     if not token:
         raise ValueError("REPLICATE_API_TOKEN environment variable is not set")
     
-    client = replicate.Client(api_token=token)
+    client = _replicate_client(token)
     
     # Build input - start with lyrics
     input_data = {"lyrics": lyrics}
@@ -43,49 +72,12 @@ async def replicate_generate_song_yue(lyrics: str, style: Optional[str] = None)
     try:
         logger.info(f"Starting Replicate song generation for lyrics (length: {len(lyrics)} chars)")
         
-        # Run the model - use async if available, otherwise run sync in thread
-        try:
-            # Try async_run if available (newer replicate versions)
-            if hasattr(client, 'async_run'):
-                output = await client.async_run("fofr/yue", input=input_data)
-            else:
-                # Fallback to sync run in thread pool
-                import asyncio
-                output = await asyncio.to_thread(client.run, "fofr/yue", input=input_data)
-        except AttributeError:
-            # Fallback to sync run
-            import asyncio
-            output = await asyncio.to_thread(client.run, "fofr/yue", input=input_data)
+        # Run the model natively on the event loop (replicate>=0.25 always has async_run)
+        output = await client.async_run("fofr/yue", input=input_data)
         
         logger.info(f"Replicate generation completed, output type: {type(output)}")
         
-        # Extract audio URL from output
-        audio_url = None
-        
-        if isinstance(output, dict):
-            # Try common keys for audio output
-            for key in ["audio", "output", "files", "url", "file"]:
-                if key in output:
-                    value = output[key]
-                    if isinstance(value, str) and (value.endswith(".mp3") or value.endswith(".wav")):
-                        audio_url = value
-                        break
-                    elif isinstance(value, list) and len(value) > 0:
-                        # If it's a list, check first item
-                        first_item = value[0]
-                        if isinstance(first_item, str) and (first_item.endswith(".mp3") or first_item.endswith(".wav")):
-                            audio_url = first_item
-                            break
-        elif isinstance(output, list) and len(output) > 0:
-            # If output is a list, find first URL ending with .mp3 or .wav
-            for item in output:
-                if isinstance(item, str) and (item.endswith(".mp3") or item.endswith(".wav")):
-                    audio_url = item
-                    break
-        elif isinstance(output, str):
-            # If output is directly a string URL
-            if output.endswith(".mp3") or output.endswith(".wav"):
-                audio_url = output
+        audio_url = _first_audio_url(output)
         
         if not audio_url:
             # Log the output for debugging
@@ -5,6 +5,7 @@ import os
 import logging
 import asyncio
 import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 import httpx
@@ -15,6 +16,38 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Upload/convert timeout, matching the gradio_client calls
+_GRADIO_TIMEOUT = 300.0
+
+
+@lru_cache(maxsize=1)
+def _http_client() -> httpx.AsyncClient:
+    """
+    Pooled client for every Gradio request (preflight and downloads),
+    shared across service instances so the connection pool and SSL
+    context are built once.
+    """
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=_GRADIO_TIMEOUT,
+        # Limits live on the transport; the client ignores its own when given one
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=120,
+            ),
+        ),
+    )
+
+
+async def aclose_http_client():
+    """Close the pooled Gradio client (app shutdown)"""
+    if _http_client.cache_info().currsize:
+        await _http_client().aclose()
+        _http_client.cache_clear()
+
 
 class RvcGradioService:
     """Service for RVC voice conversion using Gradio client"""
@@ -55,24 +88,23 @@ class RvcGradioService:
         """Check if Gradio endpoint is reachable by requesting /config"""
         config_url = f"{self.gradio_url.rstrip('/')}/config"
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=10.0) as client:
-                response = await client.get(config_url)
-                
-                if response.status_code != 200:
-                    # Log error with details
-                    response_text = response.text[:200] if response.text else "(empty response)"
-                    logger.error(
-                        f"RVC Gradio preflight check failed: "
-                        f"base_url={self.gradio_url}, "
-                        f"status_code={response.status_code}, "
-                        f"response_text={response_text}"
-                    )
-                    raise RuntimeError(
-                        f"RVC service misconfigured: Gradio endpoint not reachable at {self.gradio_url} (expected /config)."
-                    )
-                
-                self._preflight_ok = True
-                logger.info(f"RVC Gradio preflight check passed for {self.gradio_url}")
+            response = await _http_client().get(config_url, timeout=10.0)
+            
+            if response.status_code != 200:
+                # Log error with details
+                response_text = response.text[:200] if response.text else "(empty response)"
+                logger.error(
+                    f"RVC Gradio preflight check failed: "
+                    f"base_url={self.gradio_url}, "
+                    f"status_code={response.status_code}, "
+                    f"response_text={response_text}"
+                )
+                raise RuntimeError(
+                    f"RVC service misconfigured: Gradio endpoint not reachable at {self.gradio_url} (expected /config)."
+                )
+            
+            self._preflight_ok = True
+            logger.info(f"RVC Gradio preflight check passed for {self.gradio_url}")
         except httpx.TimeoutException:
             logger.error(
                 f"RVC Gradio preflight check timeout: base_url={self.gradio_url}"
@@ -112,7 +144,7 @@ class RvcGradioService:
             # Wrap in timeout (300s as specified)
             upload_result = await asyncio.wait_for(
                 asyncio.to_thread(self.client.upload_file, str(local_path)),
-                timeout=300.0
+                timeout=_GRADIO_TIMEOUT
             )
             
             # Handle both string and FileData object responses
@@ -194,7 +226,7 @@ class RvcGradioService:
                     fn_index=2,
                     api_name=None
                 ),
-                timeout=300.0
+                timeout=_GRADIO_TIMEOUT
             )
             
             # Result is typically a tuple/list with [info_text, output_audio_path]
@@ -235,12 +267,11 @@ class RvcGradioService:
         if output_ref.startswith("http://") or output_ref.startswith("https://"):
             # Download from URL
             logger.info(f"Downloading output from URL: {output_ref}")
-            async with httpx.AsyncClient(follow_redirects=True, timeout=300.0) as client:
-                response = await client.get(output_ref)
-                response.raise_for_status()
-                
-                async with aiofiles.open(dest_path, "wb") as f:
-                    await f.write(response.content)
+            response = await _http_client().get(output_ref)
+            response.raise_for_status()
+            
+            async with aiofiles.open(dest_path, "wb") as f:
+                await f.write(response.content)
             
             logger.info(f"Downloaded output to: {dest_path}")
         else:
@@ -257,12 +288,11 @@ class RvcGradioService:
             
             try:
                 logger.info(f"Downloading output from Gradio: {download_url}")
-                async with httpx.AsyncClient(follow_redirects=True, timeout=300.0) as client:
-                    response = await client.get(download_url)
-                    response.raise_for_status()
-                    
-                    async with aiofiles.open(dest_path, "wb") as f:
-                        await f.write(response.content)
+                response = await _http_client().get(download_url)
+                response.raise_for_status()
+                
+                async with aiofiles.open(dest_path, "wb") as f:
+                    await f.write(response.content)
                 
                 logger.info(f"Downloaded output to: {dest_path}")
             except Exception as e:
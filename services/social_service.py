@@ -1,7 +1,6 @@
 """
 Social Service - Business logic for social post scheduling
 """
-import json
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -9,6 +8,7 @@ from datetime import datetime
 
 from project_memory import get_or_create_project_memory
 from social_scheduler import SocialScheduler
+from utils.shared_utils import schedule_lock, read_schedule, write_schedule
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -97,14 +97,7 @@ class SocialService:
         # FALLBACK: Local JSON storage
         schedule_file = session_path / "schedule.json"
         
-        # Load existing schedule
-        if schedule_file.exists():
-            with open(schedule_file, 'r') as f:
-                schedule = json.load(f)
-        else:
-            schedule = []
-        
-        # Append new post
+        # Create post entry
         post_id = f"{platform}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         post = {
             "post_id": post_id,
@@ -117,11 +110,12 @@ class SocialService:
             "provider": "local",
             "status": "scheduled"
         }
-        schedule.append(post)
         
-        # Save
-        with open(schedule_file, 'w') as f:
-            json.dump(schedule, f, indent=2)
+        # Load, append and save under the file's lock
+        async with schedule_lock(schedule_file):
+            schedule = await read_schedule(schedule_file)
+            schedule.append(post)
+            await write_schedule(schedule_file, schedule)
         
         # Update project memory
         memory = await get_or_create_project_memory(session_id, self.media_dir)
@@ -0,0 +1,108 @@
+"""
+Numba DSP kernels vs their pure-Python / NumPy reference paths
+"""
+import importlib
+import sys
+
+import numpy as np
+import pytest
+
+from utils.dsp import jit
+from utils.dsp.compressor import _compress_1d, apply_compressor
+from utils.dsp.dynamics import soften_transients, micro_compress, smooth_vocals
+from utils.dsp.fused_dynamics import _micro_dynamics_1d, fused_micro_dynamics
+
+
+def _py(kernel):
+    # Without numba, njit is a no-op and the kernel is already plain Python
+    return getattr(kernel, "py_func", kernel)
+
+
+@pytest.fixture
+def stereo():
+    rng = np.random.default_rng(1234)
+    return (rng.standard_normal((4096, 2)) * 0.4).astype(np.float32)
+
+
+def test_compress_kernel_matches_python(stereo):
+    atk = np.exp(-1.0 / (44100 * 0.005))
+    rel = np.exp(-1.0 / (44100 * 0.05))
+    threshold = 10 ** (-18 / 20)
+
+    for ch in range(stereo.shape[1]):
+        x = stereo[:, ch]
+        jitted = np.empty_like(x)
+        reference = np.empty_like(x)
+        jitted_peak = _compress_1d(x, jitted, threshold, 4.0, atk, rel)
+        reference_peak = _py(_compress_1d)(x, reference, threshold, 4.0, atk, rel)
+
+        np.testing.assert_allclose(jitted, reference, rtol=1e-5, atol=1e-6)
+        assert jitted_peak == pytest.approx(reference_peak, rel=1e-5)
+
+
+def test_apply_compressor_keeps_channels_independent(stereo):
+    out = apply_compressor(stereo)
+    left_only = apply_compressor(np.ascontiguousarray(stereo[:, 0]))
+
+    assert out.shape == stereo.shape
+    assert out.dtype == stereo.dtype
+    np.testing.assert_allclose(out[:, 0], left_only, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("smooth_factor", [0.0, 0.12])
+def test_micro_dynamics_kernel_matches_python(stereo, smooth_factor):
+    for ch in range(stereo.shape[1]):
+        x = stereo[:, ch]
+        jitted = np.empty_like(x)
+        reference = np.empty_like(x)
+        _micro_dynamics_1d(x, jitted, 0.12, 0.55, 1.4, 0.0005, 0.005, smooth_factor)
+        _py(_micro_dynamics_1d)(x, reference, 0.12, 0.55, 1.4, 0.0005, 0.005, smooth_factor)
+
+        np.testing.assert_allclose(jitted, reference, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("smooth_factor", [0.0, 0.12])
+def test_fused_micro_dynamics_matches_numpy_chain(stereo, smooth_factor):
+    # The chain MixService falls back to when NUMBA_AVAILABLE is False,
+    # run per channel (micro_compress keeps a single scalar gain)
+    fused = fused_micro_dynamics(stereo, 0.12, 0.55, 1.4, smooth_factor)
+
+    for ch in range(stereo.shape[1]):
+        expected = soften_transients(stereo[:, ch].copy(), threshold=0.12, soften_factor=0.55)
+        expected = micro_compress(expected, ratio=1.4)
+        if smooth_factor:
+            expected = smooth_vocals(expected, smooth_factor=smooth_factor)
+
+        np.testing.assert_allclose(fused[:, ch], expected, rtol=1e-4, atol=1e-5)
+
+
+@pytest.mark.parametrize("role", ["lead_vocal", "adlib", "beat", "other"])
+def test_apply_micro_dynamics_fallback_matches_fused_on_stereo(monkeypatch, stereo, role):
+    from services import mix_service
+    from services.mix_service import MixService
+
+    # Stems from load_wav are [N, 2]; both paths must process every channel
+    monkeypatch.setattr(mix_service, "NUMBA_AVAILABLE", True)
+    fused = MixService.apply_micro_dynamics(stereo.copy(), role, out=np.empty_like(stereo))
+
+    monkeypatch.setattr(mix_service, "NUMBA_AVAILABLE", False)
+    fallback = MixService.apply_micro_dynamics(stereo.copy(), role, out=np.empty_like(stereo))
+
+    assert fallback.shape == stereo.shape
+    np.testing.assert_allclose(fallback, fused, rtol=1e-4, atol=1e-5)
+
+
+def test_njit_is_noop_without_numba(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numba", None)
+    try:
+        fallback = importlib.reload(jit)
+        assert fallback.NUMBA_AVAILABLE is False
+
+        def kernel(x):
+            return x + 1
+
+        assert fallback.njit(kernel) is kernel
+        assert fallback.njit(cache=True, fastmath=True, nogil=True)(kernel) is kernel
+    finally:
+        monkeypatch.undo()
+        importlib.reload(jit)
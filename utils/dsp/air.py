@@ -1,4 +1,5 @@
 import numpy as np
+from utils.dsp.level import peak
 
 def add_air(audio, gain_db=1.5, freq=12000):
     """
@@ -11,14 +12,14 @@ def add_air(audio, gain_db=1.5, freq=12000):
     sr = 44100
     t = np.arange(audio.shape[0])
     kernel = np.sin(2 * np.pi * freq * t / sr)
-    kernel = (kernel + 1) / 2  # normalize to 0-1
+    kernel = ((kernel + 1) / 2).astype(audio.dtype)  # normalize to 0-1, keep the audio's dtype
     
     airy = audio * (1 + (kernel[:,None] * (factor - 1)))
     
     # Normalize
-    peak = np.max(np.abs(airy))
-    if peak > 1:
-        airy = airy / peak
+    airy_peak = peak(airy)
+    if airy_peak > 1:
+        airy = airy / airy_peak
     
     return airy
 
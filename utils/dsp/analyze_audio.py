@@ -1,15 +1,53 @@
 import numpy as np
 
 
+def _waveform(mono, samples):
+    idx = np.linspace(0, len(mono) - 1, samples).astype(np.int32)
+    return mono[idx].astype(np.float32).tolist()
+
+
+def _fft_spectrum(mono, bins):
+    fft = np.fft.rfft(mono)
+    mag = np.abs(fft)
+    idx = np.linspace(0, len(mag) - 1, bins).astype(np.int32)
+    sampled = mag[idx]
+    norm = sampled / (np.max(sampled) + 1e-9)
+    return norm.astype(np.float32).tolist()
+
+
+def _energy_curve(squared, segments):
+    seg_size = len(squared) // segments
+    if seg_size == 0:
+        return [0.0] * segments
+    blocks = squared[:seg_size * segments].reshape(segments, seg_size)
+    return np.sqrt(blocks.mean(axis=1)).tolist()
+
+
+def compute_visual_bundle(audio, samples=2000, bins=256, segments=128):
+    """
+    Waveform, spectrum, levels and energy curve in one call.
+    The mono downmix and its square are computed once and shared,
+    instead of each visual re-deriving them from the full master.
+    """
+    mono = audio.mean(axis=1)
+    squared = np.square(mono)
+    return {
+        "waveform": _waveform(mono, samples),
+        "spectrum": _fft_spectrum(mono, bins),
+        "levels": {
+            "rms": float(np.sqrt(np.mean(squared))),
+            "peak": float(np.max(np.abs(mono))),
+        },
+        "energy_curve": _energy_curve(squared, segments),
+    }
+
+
 def compute_waveform(audio, samples=2000):
     """
     Downsamples waveform for UI rendering.
     Returns float32 array length = samples.
     """
-    length = audio.shape[0]
-    idx = np.linspace(0, length - 1, samples).astype(np.int32)
-    mono = audio.mean(axis=1)
-    return mono[idx].astype(np.float32).tolist()
+    return _waveform(audio.mean(axis=1), samples)
 
 
 def compute_fft_spectrum(audio, bins=256):
@@ -17,13 +55,7 @@ def compute_fft_spectrum(audio, bins=256):
     Computes magnitude spectrum for visualization.
     Returns float32 array length = bins.
     """
-    mono = audio.mean(axis=1)
-    fft = np.fft.rfft(mono)
-    mag = np.abs(fft)
-    idx = np.linspace(0, len(mag) - 1, bins).astype(np.int32)
-    sampled = mag[idx]
-    norm = sampled / (np.max(sampled) + 1e-9)
-    return norm.astype(np.float32).tolist()
+    return _fft_spectrum(audio.mean(axis=1), bins)
 
 
 def compute_levels(audio):
@@ -41,16 +73,7 @@ def compute_energy_curve(audio, segments=128):
     Computes a segment-based energy curve.
     """
     mono = audio.mean(axis=1)
-    length = len(mono)
-    seg_size = length // segments
-    curve = []
-    for i in range(segments):
-        seg = mono[i * seg_size:(i + 1) * seg_size]
-        if len(seg) > 0:
-            curve.append(float(np.sqrt(np.mean(seg ** 2))))
-        else:
-            curve.append(0.0)
-    return curve
+    return _energy_curve(np.square(mono), segments)
 
 
 def compute_track_spectrum(audio, bins=128):
@@ -61,3 +84,26 @@ def compute_track_spectrum(audio, bins=128):
     sampled = mag[idx]
     norm = sampled / (np.max(sampled) + 1e-9)
     return norm.astype(np.float32).tolist()
+
+
+def compute_track_spectra(tracks, bins=128):
+    """
+    compute_track_spectrum for several tracks at once.
+    Tracks of the same length are stacked and share one batched rfft.
+    """
+    monos = [t.mean(axis=1) for t in tracks]
+    spectra = [None] * len(monos)
+
+    by_length = {}
+    for i, mono in enumerate(monos):
+        by_length.setdefault(len(mono), []).append(i)
+
+    for indices in by_length.values():
+        mag = np.abs(np.fft.rfft(np.stack([monos[i] for i in indices]), axis=1))
+        idx = np.linspace(0, mag.shape[1]-1, bins).astype(np.int32)
+        sampled = mag[:, idx]
+        norm = sampled / (np.max(sampled, axis=1, keepdims=True) + 1e-9)
+        for i, row in zip(indices, norm.astype(np.float32)):
+            spectra[i] = row.tolist()
+
+    return spectra
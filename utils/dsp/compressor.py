@@ -1,22 +1,19 @@
 import numpy as np
 
+from utils.dsp.jit import njit
+from utils.dsp.limiter import limit_scale
 
-def apply_compressor(audio_data, threshold=-18, ratio=4.0, attack=5, release=50):
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _compress_1d(x, out, linear_threshold, ratio, atk, rel):
     """
-    Basic RMS compressor.
-    threshold in dB
-    ratio > 1
-    attack/release in ms
+    Envelope follower + gain computer for one channel.
+    Returns the output peak so a following limiter needs no extra pass.
     """
-    sr = 44100
-    atk = np.exp(-1.0 / (sr * (attack / 1000)))
-    rel = np.exp(-1.0 / (sr * (release / 1000)))
-
-    out = np.zeros_like(audio_data)
     env = 0.0
-    linear_threshold = 10 ** (threshold / 20)
-
-    for i, sample in enumerate(audio_data):
+    out_peak = 0.0
+    for i in range(x.shape[0]):
+        sample = x[i]
         abs_sample = abs(sample)
         if abs_sample > env:
             env = atk * env + (1 - atk) * abs_sample
@@ -28,7 +25,54 @@ def apply_compressor(audio_data, threshold=-18, ratio=4.0, attack=5, release=50)
         else:
             gain = 1.0
 
-        out[i] = sample * gain
+        y = sample * gain
+        out[i] = y
+        if abs(y) > out_peak:
+            out_peak = abs(y)
+
+    return out_peak
+
+
+def _compress(audio_data, threshold, ratio, attack, release):
+    sr = 44100
+    atk = np.exp(-1.0 / (sr * (attack / 1000)))
+    rel = np.exp(-1.0 / (sr * (release / 1000)))
 
+    out = np.empty_like(audio_data)
+    linear_threshold = 10 ** (threshold / 20)
+
+    if audio_data.ndim == 1:
+        out_peak = _compress_1d(audio_data, out, linear_threshold, ratio, atk, rel)
+    else:
+        out_peak = 0.0
+        for ch in range(audio_data.shape[1]):
+            out_peak = max(out_peak, _compress_1d(audio_data[:, ch], out[:, ch], linear_threshold, ratio, atk, rel))
+
+    return out, float(out_peak)
+
+
+def apply_compressor(audio_data, threshold=-18, ratio=4.0, attack=5, release=50):
+    """
+    Basic RMS compressor.
+    threshold in dB
+    ratio > 1
+    attack/release in ms
+    Stereo input is compressed per channel, each with its own envelope.
+    """
+    out, _ = _compress(audio_data, threshold, ratio, attack, release)
     return out
 
+
+def apply_compressor_limited(audio_data, threshold=-18, ratio=4.0, attack=5, release=50, ceiling=-1.0):
+    """
+    Compressor followed by the peak limiter, sharing one pass.
+    The compressor tracks its output peak, so the limiter reduces to
+    an in-place scale. Returns (audio, limiter_scale).
+    """
+    out, out_peak = _compress(audio_data, threshold, ratio, attack, release)
+
+    scale = limit_scale(out_peak, ceiling)
+    if scale < 1.0:
+        out *= scale
+
+    return out, scale
@@ -21,7 +21,7 @@ def apply_deesser(audio_data, freq=6000, threshold=-20.0, ratio=4.0):
         return audio_data
 
     gain = linear_threshold / (rms + 1e-9)
-    gain = gain ** (ratio - 1)
+    gain = float(gain ** (ratio - 1))  # Python scalar keeps audio_data's dtype
 
     return audio_data * gain
 
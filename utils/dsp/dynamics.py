@@ -1,22 +1,35 @@
 import numpy as np
 
 
-def soften_transients(samples: np.ndarray, threshold: float = 0.15, soften_factor: float = 0.6):
+def soften_transients(samples: np.ndarray, threshold: float = 0.15, soften_factor: float = 0.6, out: np.ndarray = None):
     """
     Reduces sharp peaks while keeping punch.
     """
-    peaks = np.abs(samples) > threshold
-    samples[peaks] *= soften_factor
-    return np.clip(samples, -1.0, 1.0)
+    if soften_factor != 1.0:
+        peaks = np.abs(samples) > threshold
+        samples[peaks] *= soften_factor
+    return np.clip(samples, -1.0, 1.0, out=out)
 
 
-def micro_compress(samples: np.ndarray, ratio: float = 1.3, attack: float = 0.0005, release: float = 0.005):
+def micro_compress(samples: np.ndarray, ratio: float = 1.3, attack: float = 0.0005, release: float = 0.005, out: np.ndarray = None):
     """
     A transparent micro-compressor—very subtle.
+    out may alias samples: each sample is read before it is written.
     """
-    gain = 1.0
-    out = np.zeros_like(samples)
+    # With ratio <= 1 the gain never drops below unity: only the clip remains
+    if ratio <= 1.0:
+        return np.clip(samples, -1.0, 1.0, out=out)
+
+    if out is None:
+        out = np.empty_like(samples)
+
+    # Stereo [N, C]: each channel keeps its own gain, like the fused kernel
+    if samples.ndim > 1:
+        for ch in range(samples.shape[1]):
+            micro_compress(samples[:, ch], ratio=ratio, attack=attack, release=release, out=out[:, ch])
+        return out
 
+    gain = 1.0
     for i in range(len(samples)):
         level = abs(samples[i])
 
@@ -28,21 +41,21 @@ def micro_compress(samples: np.ndarray, ratio: float = 1.3, attack: float = 0.00
         gain = max(min(gain, 1.0), 0.2)
         out[i] = samples[i] * gain
 
-    return np.clip(out, -1.0, 1.0)
+    return np.clip(out, -1.0, 1.0, out=out)
 
 
-def smooth_vocals(samples: np.ndarray, smooth_factor: float = 0.08):
+def smooth_vocals(samples: np.ndarray, smooth_factor: float = 0.08, out: np.ndarray = None):
     """
     Light smoothing by blending each sample with neighbors.
+    out may alias samples: the blend is computed before it is written.
     """
     if len(samples) < 3:
         return samples
 
-    out = samples.copy()
-    for i in range(1, len(samples)-1):
-        out[i] = (
-            samples[i] * (1 - smooth_factor) +
-            (samples[i-1] + samples[i+1]) * (smooth_factor / 2)
-        )
-    return np.clip(out, -1.0, 1.0)
-
+    if out is None:
+        out = np.empty_like(samples)
+    interior = samples[1:-1] * (1 - smooth_factor) + (samples[:-2] + samples[2:]) * (smooth_factor / 2)
+    out[0] = samples[0]
+    out[-1] = samples[-1]
+    out[1:-1] = interior
+    return np.clip(out, -1.0, 1.0, out=out)
@@ -1,25 +1,92 @@
-import wave
-import struct
 import numpy as np
+import soundfile as sf
 
+from utils.dsp.level import peak
 
-def save_wav(path, audio, sr=44100):
-    # Ensure stereo
+
+def _chunked_peak(audio, chunk):
+    audio_peak = 0.0
+    for start in range(0, audio.shape[0], chunk):
+        audio_peak = max(audio_peak, peak(audio[start:start + chunk]))
+    return audio_peak
+
+
+def save_wav(path, audio, sr=44100, chunk=65536):
+    """
+    Peak-normalized int16 export.
+    Converts and writes `chunk` frames at a time through a reusable int16
+    buffer, so export memory stays O(chunk) instead of O(N).
+    """
+    # Mono is broadcast to both channels
     if audio.ndim == 1:
-        audio = np.stack([audio, audio], axis=1)
+        audio = audio[:, None]
 
-    # Normalize for int16 export
-    peak = np.max(np.abs(audio))
-    if peak > 1.0:
-        audio = audio / peak
+    n = audio.shape[0]
+    audio_peak = _chunked_peak(audio, chunk)
+    scale = 32767 / audio_peak if audio_peak > 1.0 else 32767
 
-    audio_int16 = (audio * 32767).astype(np.int16)
+    frames = np.empty((min(chunk, n), 2), dtype=np.int16)
 
-    with wave.open(path, "wb") as wav:
-        wav.setnchannels(2)
-        wav.setsampwidth(2)
-        wav.setframerate(sr)
-        wav.writeframes(audio_int16.tobytes())
+    with sf.SoundFile(path, "w", samplerate=sr, channels=2, subtype="PCM_16", format="WAV") as wav:
+        for start in range(0, n, chunk):
+            stop = min(start + chunk, n)
+            # Peak-normalized, so |x * scale| <= 32767: scale and cast in one ufunc
+            block = frames[:stop - start]
+            np.multiply(audio[start:stop], scale, out=block, casting="unsafe")
+            wav.write(block)
 
     return path
 
+
+def _mid_side_block(left, right, side_gain, mid, side):
+    np.add(left, right, out=mid)
+    mid *= 0.5
+    np.subtract(left, right, out=side)
+    side *= side_gain
+    return mid, side
+
+
+def save_wav_from_mid_side(path, audio, widen_amount=0.2, sr=44100, chunk=65536):
+    """
+    Mid/Side widening fused into the int16 export.
+    L/R are written straight from mid/side into the int16 frame buffer one
+    chunk at a time, so no widened float copy of the master is kept around.
+    """
+    if audio.ndim == 1:
+        audio = audio[:, None]
+
+    n = audio.shape[0]
+    left = audio[:, 0]
+    right = audio[:, -1]
+    side_gain = 0.5 * (1 + widen_amount)
+
+    mid_buf = np.empty(min(chunk, n), dtype=np.result_type(audio.dtype, np.float32))
+    side_buf = np.empty_like(mid_buf)
+
+    # max(|mid + side|, |mid - side|) == |mid| + |side|
+    peak = 0.0
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        mid, side = _mid_side_block(left[start:stop], right[start:stop], side_gain,
+                                    mid_buf[:stop - start], side_buf[:stop - start])
+        np.abs(mid, out=mid)
+        np.abs(side, out=side)
+        mid += side
+        peak = max(peak, float(np.max(mid)))
+    scale = 32767 / peak if peak > 1.0 else 32767
+
+    frames = np.empty((mid_buf.shape[0], 2), dtype=np.int16)
+
+    with sf.SoundFile(path, "w", samplerate=sr, channels=2, subtype="PCM_16", format="WAV") as wav:
+        for start in range(0, n, chunk):
+            stop = min(start + chunk, n)
+            mid, side = _mid_side_block(left[start:stop], right[start:stop], side_gain,
+                                        mid_buf[:stop - start], side_buf[:stop - start])
+            mid *= scale
+            side *= scale
+            block = frames[:stop - start]
+            np.add(mid, side, out=block[:, 0], casting="unsafe")
+            np.subtract(mid, side, out=block[:, 1], casting="unsafe")
+            wav.write(block)
+
+    return path
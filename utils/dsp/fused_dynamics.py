@@ -0,0 +1,68 @@
+import numpy as np
+
+from utils.dsp.jit import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _micro_dynamics_1d(x, out, threshold, soften_factor, ratio, attack, release, smooth_factor):
+    """
+    soften_transients → micro_compress → smooth_vocals for one channel,
+    in a single pass. Sample i is smoothed once sample i + 1 has been
+    compressed, so out may alias x.
+    """
+    n = x.shape[0]
+    gain = 1.0
+    centre = 1.0 - smooth_factor
+    neighbour = smooth_factor * 0.5
+    prev = 0.0
+    cur = 0.0
+
+    for i in range(n):
+        # Soften transients
+        v = x[i]
+        if abs(v) > threshold:
+            v *= soften_factor
+        v = min(max(v, -1.0), 1.0)
+
+        # Micro-compress (stateful, so this loop stays sequential)
+        if ratio > 1.0:
+            level = abs(v)
+            if level > 0.2:
+                gain -= (level - 0.2) * (ratio - 1.0) * attack
+            else:
+                gain += release
+            gain = max(min(gain, 1.0), 0.2)
+            v = min(max(v * gain, -1.0), 1.0)
+
+        # Smooth: emit sample i - 1 now that its right neighbour is known
+        if i >= 2:
+            s = cur * centre + (prev + v) * neighbour
+            out[i - 1] = min(max(s, -1.0), 1.0)
+        elif i == 1:
+            out[0] = cur
+
+        prev = cur
+        cur = v
+
+    if n > 0:
+        out[n - 1] = cur
+
+
+def fused_micro_dynamics(samples: np.ndarray, threshold: float, soften_factor: float, ratio: float,
+                         smooth_factor: float = 0.0, attack: float = 0.0005, release: float = 0.005,
+                         out: np.ndarray = None):
+    """
+    Fused micro-dynamics chain. Each channel keeps its own compressor gain.
+    smooth_factor=0.0 skips smoothing.
+    """
+    if out is None:
+        out = np.empty_like(samples)
+
+    if samples.ndim == 1:
+        _micro_dynamics_1d(samples, out, threshold, soften_factor, ratio, attack, release, smooth_factor)
+    else:
+        for ch in range(samples.shape[1]):
+            _micro_dynamics_1d(samples[:, ch], out[:, ch], threshold, soften_factor, ratio,
+                               attack, release, smooth_factor)
+
+    return out
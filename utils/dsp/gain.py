@@ -1,7 +1,9 @@
 import numpy as np
 
 
-def apply_gain(audio_data, gain_db=0.0):
-    factor = 10 ** (gain_db / 20)
-    return audio_data * factor
-
+def apply_gain(audio_data, gain_db=0.0, out=None):
+    """
+    Scale by gain_db. Pass out=audio_data to apply in place.
+    """
+    factor = 10 ** (gain_db / 20)  # Python float keeps float32 input float32
+    return np.multiply(audio_data, factor, out=out)
@@ -0,0 +1,25 @@
+"""
+Optional Numba JIT support for DSP kernels.
+When numba is not installed, njit is a no-op decorator and callers
+should check NUMBA_AVAILABLE before choosing a per-sample kernel.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+NUMBA_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    logger.info("ℹ️ numba not installed. DSP kernels will use the NumPy fallbacks.")
+
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
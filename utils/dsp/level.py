@@ -5,6 +5,12 @@ def rms(samples: np.ndarray) -> float:
         return 0.0
     return float(np.sqrt(np.mean(np.square(samples))))
 
+def peak(samples: np.ndarray) -> float:
+    # Absolute peak from two SIMD reductions, without an np.abs temporary
+    if samples.size == 0:
+        return 0.0
+    return float(max(np.max(samples), -np.min(samples)))
+
 def lufs(samples: np.ndarray) -> float:
     # Simple LUFS approximation (ITU BS.1770 weighting optional)
     if samples.size == 0:
@@ -1,16 +1,25 @@
 import numpy as np
+from utils.dsp.level import peak
 
 
-def apply_limiter(audio_data, ceiling=-1.0):
+def limit_scale(audio_peak, ceiling=-1.0):
     """
-    Simple peak limiter.
-    ceiling in dBFS
+    Gain that brings audio_peak down to the ceiling (dBFS); 1.0 when
+    already under it. Clamping the peak from below avoids both the
+    branch and a divide by zero on silence.
     """
     linear_ceiling = 10 ** (ceiling / 20)
-    peak = np.max(np.abs(audio_data))
+    return linear_ceiling / max(audio_peak, linear_ceiling)
 
-    if peak > linear_ceiling:
-        audio_data = audio_data * (linear_ceiling / peak)
 
-    return audio_data
+def apply_limiter(audio_data, ceiling=-1.0, out=None):
+    """
+    Simple peak limiter.
+    ceiling in dBFS
+    Pass out=audio_data to limit in place.
+    """
+    scale = limit_scale(peak(audio_data), ceiling)
 
+    if out is None:
+        return audio_data if scale == 1.0 else audio_data * scale
+    return np.multiply(audio_data, scale, out=out)
@@ -1,6 +1,5 @@
 import numpy as np
 import wave
-import struct
 
 
 def load_wav(path, target_sr=44100):
@@ -9,8 +8,10 @@ def load_wav(path, target_sr=44100):
         sr = wav.getframerate()
         frames = wav.getnframes()
         audio = wav.readframes(frames)
-        samples = struct.unpack("<" + ("h" * frames * channels), audio)
-        audio_np = np.array(samples, dtype=np.float32) / 32768.0
+        # View the PCM bytes directly; one vectorized cast + scale to float32
+        samples = np.frombuffer(audio, dtype="<i2")
+        audio_np = samples.astype(np.float32)
+        audio_np *= np.float32(1.0 / 32768.0)
 
         if channels == 2:
             audio_np = audio_np.reshape(-1, 2)
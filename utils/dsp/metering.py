@@ -13,3 +13,16 @@ def compute_gain_reduction(input_signal, output_signal):
     gr = np.clip(gr, 0, None)
     return gr.astype(np.float32).tolist()
 
+
+
+def compute_scaled_gain_reduction(output_signal, scale):
+    """
+    Gain reduction for a static scale (e.g. the peak limiter), derived
+    from the output alone: |in| - |out| == |out| * (1 - scale) / scale.
+    Returns float32 list.
+    """
+    if scale >= 1.0:
+        return np.zeros(output_signal.shape[0], dtype=np.float32).tolist()
+    out = np.abs(output_signal.mean(axis=1))
+    gr = out * ((1.0 - scale) / scale)
+    return gr.astype(np.float32).tolist()
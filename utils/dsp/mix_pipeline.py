@@ -1,18 +1,31 @@
 from .eq import apply_eq
-from .compressor import apply_compressor
+from .compressor import apply_compressor, apply_compressor_limited
 from .saturator import apply_saturation
-from .limiter import apply_limiter
 from .gain import apply_gain
 from utils.dsp.deesser import apply_deesser
 from utils.dsp.air import add_air
 from utils.dsp.stereo import stereo_widen
 from utils.mix.roles import detect_role
 from utils.mix.role_presets import ROLE_PRESETS
-from utils.dsp.metering import compute_gain_reduction
+from utils.dsp.metering import compute_gain_reduction, compute_scaled_gain_reduction
 from utils.dsp.scope import compute_scope
+from utils.dsp.level import peak
 import numpy as np
 
 
+# Map role names to preset keys
+_PRESET_ROLE_MAP = {
+    "lead": "lead_vocal",
+    "lead_vocal": "lead_vocal",
+    "main_vocal": "lead_vocal",
+    "adlib": "adlib",
+    "backing_vocal": "adlib",
+    "beat": "beat",
+    "instrumental": "beat",
+    "bass": "bass",
+}
+
+
 def match_loudness(audio, target_rms=-20.0):
     rms = np.sqrt(np.mean(audio**2))
     if rms < 1e-9:
@@ -35,18 +48,7 @@ def align_tracks(tracks):
 
 def process_track(audio_data, config):
     role = config.get("role", "unknown")
-    # Map role names to preset keys
-    role_map = {
-        "lead": "lead_vocal",
-        "lead_vocal": "lead_vocal",
-        "main_vocal": "lead_vocal",
-        "adlib": "adlib",
-        "backing_vocal": "adlib",
-        "beat": "beat",
-        "instrumental": "beat",
-        "bass": "bass",
-    }
-    preset_key = role_map.get(role, "beat")  # Default to beat if role not found
+    preset_key = _PRESET_ROLE_MAP.get(role, "beat")  # Default to beat if role not found
     preset_raw = ROLE_PRESETS.get(preset_key, {})
     
     # Convert Pydantic model to dict if needed
@@ -72,13 +74,14 @@ def process_track(audio_data, config):
     sat_amount = config.get("saturation", 0.0)
     gain_db = config.get("gain", 0.0)
 
-    processed = audio_data.copy()
+    # Every stage below returns a new buffer, so the input is never mutated
+    processed = audio_data
 
     if eq_settings:
         processed = apply_eq(processed, eq_settings)
 
     if comp:
-        audio_in = processed.copy()
+        audio_in = processed  # apply_compressor writes to a new buffer
         processed = apply_compressor(
             processed,
             threshold=comp.get("threshold", -18),
@@ -90,8 +93,14 @@ def process_track(audio_data, config):
     else:
         gr_curve = []
 
-    processed = apply_saturation(processed, sat_amount)
-    processed = apply_gain(processed, gain_db)
+    # Earlier stages hand back fresh buffers; only the caller's own
+    # input has to be copied before saturating in place
+    processed = apply_saturation(
+        processed, sat_amount, out=None if processed is audio_data else processed
+    )
+    if gain_db:
+        # processed is now always our own buffer, so scale it in place
+        apply_gain(processed, gain_db, out=processed)
 
     # Apply de-esser for vocals only
     if role in ["lead", "double", "harmony", "adlib"]:
@@ -112,25 +121,39 @@ def process_track(audio_data, config):
 
 def process_master_bus(mix, cfg):
     mix = apply_eq(mix, cfg.get("eq", []))
-    mix = apply_compressor(
+    # Limiter rides on the compressor pass: its output peak is tracked
+    # in the kernel, so limiting is one in-place scale
+    mix, limit_scale = apply_compressor_limited(
         mix,
         threshold=cfg.get("threshold", -14),
         ratio=cfg.get("ratio", 2.0),
         attack=cfg.get("attack", 10),
-        release=cfg.get("release", 50)
+        release=cfg.get("release", 50),
+        ceiling=cfg.get("ceiling", -1.0)
     )
-    audio_in = mix.copy()
-    mix = apply_limiter(mix, ceiling=cfg.get("ceiling", -1.0))
-    master_gr = compute_gain_reduction(audio_in, mix)
+    master_gr = compute_scaled_gain_reduction(mix, limit_scale)
     return mix, {"gr": master_gr}
 
 
+BLEND_TILE = 16384  # frames per tile; keeps the accumulator tile cache-resident
+
+
 def blend_tracks(tracks):
-    # Use aligned tracks
-    tracks = align_tracks(tracks)
-    mix = np.sum(tracks, axis=0)
-    peak = np.max(np.abs(mix))
-    if peak > 1.0:
-        mix = mix / peak
+    # Sum into one preallocated buffer, tile by tile; shorter tracks are
+    # implicitly zero-padded, so no aligned copies of the stems are made
+    max_len = max(t.shape[0] for t in tracks)
+    mix = np.zeros((max_len,) + tracks[0].shape[1:], dtype=np.result_type(*tracks))
+
+    mix_peak = 0.0
+    for start in range(0, max_len, BLEND_TILE):
+        stop = min(start + BLEND_TILE, max_len)
+        tile = mix[start:stop]
+        for t in tracks:
+            if t.shape[0] > start:
+                tile[:min(stop, t.shape[0]) - start] += t[start:stop]
+        mix_peak = max(mix_peak, peak(tile))
+
+    if mix_peak > 1.0:
+        mix /= mix_peak
     return mix
 
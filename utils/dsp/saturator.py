@@ -1,11 +1,21 @@
 import numpy as np
 
 
-def apply_saturation(audio_data, amount=0.5):
+def apply_saturation(audio_data, amount=0.5, out=None):
     """
     Soft clipping saturation.
-    amount: 0.0–1.0
+    amount: 0.0–1.0 (0 is a clean pass-through)
+    Pass out=audio_data to saturate in place.
     """
-    k = amount * 10  
-    return np.tanh(k * audio_data) / np.tanh(k)
+    if amount <= 0:
+        # tanh(k*x)/tanh(k) -> x as k -> 0; evaluating it at 0 gives 0/0
+        if out is None:
+            return audio_data.copy()
+        np.copyto(out, audio_data)
+        return out
 
+    k = amount * 10
+    out = np.multiply(audio_data, k, out=out)
+    np.tanh(out, out=out)
+    out *= 1.0 / float(np.tanh(k))  # Python scalar keeps float32 input float32
+    return out
@@ -1,6 +1,14 @@
 import numpy as np
 
 
+# Roles spatial_pocket reshapes; every other role passes through untouched
+SPATIAL_ROLES = frozenset([
+    "lead_vocal", "lead", "main_vocal",
+    "beat", "drums", "full_mix",
+    "adlib", "backing_vocal",
+])
+
+
 def mid_side_encode(stereo: np.ndarray):
     """
     Converts stereo [2, N] into Mid (+) and Side (-).
@@ -1,4 +1,5 @@
 import numpy as np
+from utils.dsp.level import peak
 
 def stereo_widen(audio, amount=0.2):
     """
@@ -16,9 +17,9 @@ def stereo_widen(audio, amount=0.2):
     widened = np.stack([L, R], axis=1)
     
     # Normalize if needed
-    peak = np.max(np.abs(widened))
-    if peak > 1:
-        widened /= peak
+    widened_peak = peak(widened)
+    if widened_peak > 1:
+        widened /= widened_peak
     
     return widened
 
@@ -67,57 +67,30 @@ def align_stems(audio_data_dict: dict, sample_rate: int = 44100) -> dict:
     vocal_onset = detect_onset(vocal_audio, sample_rate)
     
     # Calculate offset (how much to shift vocal)
+    # Positive offset pads the vocal at the beginning, negative trims it
     offset_samples = beat_onset - vocal_onset
     
-    # If offset is positive, we need to pad the vocal at the beginning
-    # If offset is negative, we need to trim the vocal at the beginning
-    if offset_samples > 0:
-        # Pad vocal at the beginning
-        if vocal_audio.ndim == 2:
-            # Stereo
-            padding = np.zeros((offset_samples, 2), dtype=vocal_audio.dtype)
-            aligned_vocal = np.vstack([padding, vocal_audio])
-        else:
-            # Mono
-            padding = np.zeros(offset_samples, dtype=vocal_audio.dtype)
-            aligned_vocal = np.concatenate([padding, vocal_audio])
-    elif offset_samples < 0:
-        # Trim vocal at the beginning
-        trim_samples = abs(offset_samples)
-        if vocal_audio.ndim == 2:
-            aligned_vocal = vocal_audio[trim_samples:, :]
-        else:
-            aligned_vocal = vocal_audio[trim_samples:]
-    else:
-        # No alignment needed
-        aligned_vocal = vocal_audio
-    
-    # Ensure both stems have the same length (pad shorter one with zeros)
-    beat_length = beat_audio.shape[0]
-    vocal_length = aligned_vocal.shape[0]
+    # Both stems end up the same length (shorter one zero-padded at the end)
+    vocal_length = max(vocal_audio.shape[0] + offset_samples, 0)
+    target_length = max(beat_audio.shape[0], vocal_length)
     
-    if beat_length > vocal_length:
-        # Pad vocal to match beat length
-        pad_samples = beat_length - vocal_length
-        if aligned_vocal.ndim == 2:
-            padding = np.zeros((pad_samples, 2), dtype=aligned_vocal.dtype)
-            aligned_vocal = np.vstack([aligned_vocal, padding])
-        else:
-            padding = np.zeros(pad_samples, dtype=aligned_vocal.dtype)
-            aligned_vocal = np.concatenate([aligned_vocal, padding])
-    elif vocal_length > beat_length:
-        # Pad beat to match vocal length
-        pad_samples = vocal_length - beat_length
-        if beat_audio.ndim == 2:
-            padding = np.zeros((pad_samples, 2), dtype=beat_audio.dtype)
-            aligned_beat = np.vstack([beat_audio, padding])
-        else:
-            padding = np.zeros(pad_samples, dtype=beat_audio.dtype)
-            aligned_beat = np.concatenate([beat_audio, padding])
-        audio_data_dict["beat"] = aligned_beat
-    
-    # Update the vocal in the dictionary
-    audio_data_dict["vocal"] = aligned_vocal
+    audio_data_dict["vocal"] = _place(vocal_audio, offset_samples, target_length)
+    audio_data_dict["beat"] = _place(beat_audio, 0, target_length)
     
     return audio_data_dict
 
+
+def _place(audio, offset, length):
+    """
+    Return `audio` shifted by `offset` samples inside a zero buffer of
+    `length` samples, allocated once. Returned as-is when nothing moves.
+    """
+    if offset == 0 and audio.shape[0] == length:
+        return audio
+    
+    placed = np.zeros((length,) + audio.shape[1:], dtype=audio.dtype)
+    src = audio[max(-offset, 0):]
+    start = max(offset, 0)
+    count = min(src.shape[0], length - start)
+    placed[start:start + count] = src[:count]
+    return placed
@@ -1,30 +1,42 @@
 import numpy as np
 
+# Stems are [N, channels]: every transform runs along axis 0 (time),
+# so each channel is filtered independently in one batched FFT.
+
+
+def _freqs(samples: np.ndarray):
+    return np.fft.rfftfreq(samples.shape[0], 1/44100)
+
+
+def _tilt_curve(freqs: np.ndarray, tilt: float):
+    return 1 + (tilt * (freqs / freqs.max()))
+
+
+def _band_curve(freqs: np.ndarray, low: float, high: float, gain: float):
+    curve = np.ones_like(freqs)
+    curve[(freqs > low) & (freqs < high)] = gain
+    return curve
+
+
+def _apply_curve(samples: np.ndarray, curve: np.ndarray):
+    spectrum = np.fft.rfft(samples, axis=0)
+    spectrum *= curve.reshape((-1,) + (1,) * (samples.ndim - 1))
+    return np.fft.irfft(spectrum, samples.shape[0], axis=0)
+
+
 def spectral_tilt(samples: np.ndarray, tilt: float = 0.10):
     """
     Applies a gentle tilt EQ: boosts highs slightly & reduces lows slightly.
     Positive tilt brightens; negative tilt darkens.
     """
-    freqs = np.fft.rfftfreq(len(samples), 1/44100)
-    spectrum = np.fft.rfft(samples)
-
-    tilt_curve = 1 + (tilt * (freqs / freqs.max()))
-    spectrum *= tilt_curve
-
-    output = np.fft.irfft(spectrum, len(samples))
+    output = _apply_curve(samples, _tilt_curve(_freqs(samples), tilt))
     return output.astype(np.float32)
 
 def low_mid_cleanup(samples: np.ndarray, amount: float = 0.12):
     """
     Reduces 200–450 Hz mud region.
     """
-    freqs = np.fft.rfftfreq(len(samples), 1/44100)
-    spectrum = np.fft.rfft(samples)
-
-    mask = (freqs > 180) & (freqs < 450)
-    spectrum[mask] *= (1 - amount)
-
-    output = np.fft.irfft(spectrum, len(samples))
+    output = _apply_curve(samples, _band_curve(_freqs(samples), 180, 450, 1 - amount))
     return output.astype(np.float32)
 
 def presence_boost(samples: np.ndarray, amount: float = 0.10):
@@ -32,38 +44,36 @@ def presence_boost(samples: np.ndarray, amount: float = 0.10):
     Adds upper-mid presence without harshness.
     2.5–5 kHz.
     """
-    freqs = np.fft.rfftfreq(len(samples), 1/44100)
-    spectrum = np.fft.rfft(samples)
-
-    mask = (freqs > 2500) & (freqs < 5000)
-    spectrum[mask] *= (1 + amount)
-
-    output = np.fft.irfft(spectrum, len(samples))
+    output = _apply_curve(samples, _band_curve(_freqs(samples), 2500, 5000, 1 + amount))
     return output.astype(np.float32)
 
-def tonal_balance_chain(samples: np.ndarray, role: str):
+def tonal_balance_chain(samples: np.ndarray, role: str, out: np.ndarray = None):
     """
     Applies role-aware tonal shaping.
+    The stages are all linear spectral gains, so their curves are
+    multiplied together and applied in a single FFT round trip.
     """
+    freqs = _freqs(samples)
+
     # Lead vocals — bright but smooth
     if role in ["lead_vocal", "lead", "main_vocal"]:
-        samples = spectral_tilt(samples, tilt=0.12)
-        samples = low_mid_cleanup(samples, amount=0.15)
-        samples = presence_boost(samples, amount=0.10)
+        curve = _tilt_curve(freqs, 0.12)
+        curve *= _band_curve(freqs, 180, 450, 1 - 0.15)
+        curve *= _band_curve(freqs, 2500, 5000, 1 + 0.10)
 
     # Adlibs/backing — lighter shaping
     elif role in ["adlib", "backing_vocal"]:
-        samples = spectral_tilt(samples, tilt=0.10)
-        samples = presence_boost(samples, amount=0.07)
+        curve = _tilt_curve(freqs, 0.10)
+        curve *= _band_curve(freqs, 2500, 5000, 1 + 0.07)
 
     # Beat — clean low-mids, preserve punch
     elif role in ["beat", "drums", "kick", "snare"]:
-        samples = low_mid_cleanup(samples, amount=0.10)
-        samples = spectral_tilt(samples, tilt=0.08)
+        curve = _band_curve(freqs, 180, 450, 1 - 0.10)
+        curve *= _tilt_curve(freqs, 0.08)
 
     # Default
     else:
-        samples = spectral_tilt(samples, tilt=0.08)
-        samples = low_mid_cleanup(samples, amount=0.12)
+        curve = _tilt_curve(freqs, 0.08)
+        curve *= _band_curve(freqs, 180, 450, 1 - 0.12)
 
-    return np.clip(samples, -1.0, 1.0)
+    return np.clip(_apply_curve(samples, curve), -1.0, 1.0, out=out)
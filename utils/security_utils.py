@@ -28,6 +28,9 @@ ALLOWED_EXTENSIONS = [".wav", ".mp3", ".aiff", ".wave", ".webm", ".ogg"]
 # 50MB in bytes
 MAX_FILE_SIZE = 50 * 1024 * 1024
 
+# Null bytes and directory separators, stripped in one pass
+_UNSAFE_PATH_CHARS = str.maketrans('', '', '\x00/\\')
+
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -48,11 +51,8 @@ def sanitize_filename(filename: str) -> str:
     if not filename:
         raise ValueError("Filename cannot be empty")
     
-    # Remove null bytes
-    filename = filename.replace("\x00", "")
-    
-    # Remove directory separators
-    filename = filename.replace("/", "").replace("\\", "")
+    # Remove null bytes and directory separators
+    filename = filename.translate(_UNSAFE_PATH_CHARS)
     
     # Remove path traversal sequences
     while ".." in filename:
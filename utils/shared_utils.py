@@ -1,8 +1,11 @@
 """
 Shared utility functions for routers and services
 """
+import os
 import json
+import asyncio
 import logging
+import weakref
 import time
 import hashlib
 import uuid
@@ -138,6 +141,52 @@ def get_project_media_path(project_id: str) -> Path:
     return path
 
 
+# One lock per schedule.json; entries drop out once no caller holds them
+_SCHEDULE_LOCKS = weakref.WeakValueDictionary()
+
+
+def schedule_lock(schedule_file: Path) -> asyncio.Lock:
+    """
+    Lock guarding a session's schedule.json. Hold it across the whole
+    read-modify-write so concurrent posts can't drop each other.
+    """
+    key = str(schedule_file)
+    lock = _SCHEDULE_LOCKS.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _SCHEDULE_LOCKS[key] = lock
+    return lock
+
+
+def _read_schedule(schedule_file: Path) -> list:
+    if not schedule_file.exists():
+        return []
+    with open(schedule_file, 'r') as f:
+        return json.load(f)
+
+
+def _write_schedule(schedule_file: Path, schedule: list):
+    # Write a temp file and swap it in, so readers never see it half-written
+    tmp_file = schedule_file.with_name(f".{schedule_file.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(schedule, f, indent=2)
+        os.replace(tmp_file, schedule_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+async def read_schedule(schedule_file: Path) -> list:
+    """Load a session's schedule.json (empty list if missing) in a worker thread"""
+    return await asyncio.to_thread(_read_schedule, schedule_file)
+
+
+async def write_schedule(schedule_file: Path, schedule: list):
+    """Atomically write a session's schedule.json in a worker thread"""
+    await asyncio.to_thread(_write_schedule, schedule_file, schedule)
+
+
 def log_endpoint_event(endpoint: str, session_id: Optional[str] = None, result: str = "success", details: Optional[dict] = None):
     """Log endpoint execution to app.log"""
     log_data = {